@@ -5,6 +5,15 @@ TAG_PRIORITIES: Final[dict[str, int]] = {
     "user_contributed": 1,
 }
 
+# Rank of a tag list with no prioritized tag.
+DEFAULT_TAG_PRIORITY: Final[int] = 2
+
+# Tags with priority 0, 1, ... below the default, so ranking a tag list is a few set intersections.
+TAGS_BY_PRIORITY: Final[tuple[frozenset[str], ...]] = tuple(
+    frozenset(tag for tag, priority in TAG_PRIORITIES.items() if priority == level)
+    for level in range(DEFAULT_TAG_PRIORITY)
+)
+
 FLAG_TO_TAG: Final[dict[str, str]] = {
     "GUIDE_ARCHIVED": "archived",
     "GUIDE_STARRED": "starred",
@@ -17,6 +26,10 @@ FLAG_TO_TAG: Final[dict[str, str]] = {
     # "NO_DETAILS": "no_details"
 }
 
+# Bit i of a flag mask stands for the i-th FLAG_TO_TAG entry, so tags come out in definition order.
+FLAG_BITS: Final[dict[str, int]] = {flag: 1 << i for i, flag in enumerate(FLAG_TO_TAG)}
+TAG_TABLE: Final[tuple[str, ...]] = tuple(FLAG_TO_TAG.values())
+
 METADATA_KEYS: Final[set[str]] = {
     "attrs",
     "contents_json",
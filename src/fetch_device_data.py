@@ -1,6 +1,7 @@
 import argparse
 import asyncio
 import collections
+import dataclasses
 import json
 import logging
 import os
@@ -22,6 +23,11 @@ from ifixit_api_client import IFixitAPIClient
 from rate_limiter import _RateLimiter
 from utils import _DeviceDataUtils
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logger = logging.getLogger(__name__)
 log_level = logging.DEBUG if os.getenv("DEBUG") else logging.INFO
@@ -42,7 +48,7 @@ logging.getLogger("ifixit_api_client").addFilter(Suppress404Filter())
 type JsonValue = dict[str, "JsonValue"] | list["JsonValue"] | str | int | float | bool | None
 
 
-def write_json_atomic(path: str, data: object) -> None:
+def write_json_atomic(path: str, data: object, *, fsync: bool = False) -> None:
     """
     Atomically writes JSON data to a specified file. This function creates a temporary
     file to ensure that the write operation is safer and minimizes the potential loss
@@ -53,13 +59,21 @@ def write_json_atomic(path: str, data: object) -> None:
     Args:
         path: The path to the target file.
         data: The JSON-serializable data to be written.
+        fsync: Flush the temporary file to disk before replacing the target. The rename
+            is atomic either way; this only adds durability against power loss.
     """
     target = Path(path)
     tmp_dir = target.parent if str(target.parent) else Path(".")
-    with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=tmp_dir, delete=False) as tmp:
-        json.dump(data, tmp, ensure_ascii=False, indent=2)
+    # Serialized up front and written in one call; like ensure_ascii=False, orjson emits non-ASCII as UTF-8.
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(data, ensure_ascii=False, indent=2).encode()
+    with tempfile.NamedTemporaryFile("wb", dir=tmp_dir, delete=False) as tmp:
+        tmp.write(payload)
         tmp.flush()
-        os.fsync(tmp.fileno())
+        if fsync:
+            os.fsync(tmp.fileno())
         tmp_name = tmp.name
     os.replace(tmp_name, target)
 
@@ -219,7 +233,9 @@ def get_child_devices_for_categories(
     return child_devices
 
 
-def fetch_teardown_guides(client: IFixitAPIClient) -> dict[str, list[dict[str, object]]]:
+def fetch_teardown_guides(
+    client: IFixitAPIClient,
+) -> tuple[dict[str, list[dict[str, object]]], dict[str, list[dict[str, object]]]]:
     """Fetch all teardown guides grouped by category.
 
     Retrieves guides with pagination and groups them by category. Each guide keeps its
@@ -229,8 +245,10 @@ def fetch_teardown_guides(client: IFixitAPIClient) -> dict[str, list[dict[str, o
         client: The IFixitAPIClient instance.
 
     Returns:
-        A dictionary mapping normalized categories to a list of guide dicts:
-        {'title': str, 'url': str, 'tags': list[str]}.
+        Two dictionaries mapping categories to a list of guide dicts
+        {'title': str, 'url': str, 'tags': list[str]}: the first keyed by
+        `_DeviceDataUtils.cheap_key`, the second by `_DeviceDataUtils.normalize_key`.
+        Use `find_teardown_guides` to query them.
     """
     params = {"filter": "teardown", "limit": 200}
     results: dict[str, list[dict[str, object]]] = {}
@@ -362,13 +380,41 @@ def fetch_teardown_guides(client: IFixitAPIClient) -> dict[str, list[dict[str, o
     for category in list(results.keys()):
         results[category] = sort_guides_for_category(category, results[category])
 
-    # Build normalized lookup to make matching resilient.
+    # Build a cheap lookup for the common case plus a normalized one to make matching resilient.
+    cheap_results: dict[str, list[dict[str, object]]] = {
+        _DeviceDataUtils.cheap_key(category): guides for category, guides in results.items()
+    }
     normalized_results: dict[str, list[dict[str, object]]] = {
         _DeviceDataUtils.normalize_key(category): guides for category, guides in results.items()
     }
 
     logger.info("Fetched %d categories with teardown guides", len(results))
-    return normalized_results
+    return cheap_results, normalized_results
+
+
+def find_teardown_guides(
+    guides_by_cheap: dict[str, list[dict[str, object]]],
+    guides_by_normalized: dict[str, list[dict[str, object]]],
+    name: str,
+) -> list[dict[str, object]]:
+    """Look up teardown guides for a device name.
+
+    Tries the cheap key first, since most iFixit names have no punctuation to normalize,
+    and only falls back to the regex-based normalized key on a miss.
+
+    Args:
+        guides_by_cheap: Guides keyed by `_DeviceDataUtils.cheap_key`.
+        guides_by_normalized: Guides keyed by `_DeviceDataUtils.normalize_key`.
+        name: Device name.
+
+    Returns:
+        The matching guides, or an empty list.
+    """
+    return (
+        guides_by_cheap.get(_DeviceDataUtils.cheap_key(name))
+        or guides_by_normalized.get(_DeviceDataUtils.normalize_key(name))
+        or []
+    )
 
 
 def print_device_data(
@@ -376,10 +422,23 @@ def print_device_data(
     devices: list[str],
     french_scraper: FrenchRepairabilityScraper,
     output_file: Optional[str] = None,
+    rate_limiter: Optional[_RateLimiter] = None,
 ) -> None:
-    """Fetches and prints device repairability scores and guide URLs concurrently."""
+    """Fetches and prints device repairability scores and guide URLs concurrently.
+
+    Args:
+        client: iFixit API client.
+        devices: Device names to look up.
+        french_scraper: Scraper whose French scores are matched against the devices.
+        output_file: Optional JSON file the scores are written to.
+        rate_limiter: Limiter pacing the score requests, shared with the client so 429
+            Retry-After delays reach it; a 4 requests/s limiter is created when omitted.
+    """
     logger.info("Fetching teardown guides for matching...")
-    teardown_guides = fetch_teardown_guides(client)
+    guides_by_cheap, guides_by_normalized = fetch_teardown_guides(client)
+
+    def teardown_guides_for(name: str) -> list[dict[str, object]]:
+        return find_teardown_guides(guides_by_cheap, guides_by_normalized, name)
 
     def dedupe(seq: list[str]) -> list[str]:
         seen: Set[str] = set()
@@ -399,14 +458,11 @@ def print_device_data(
                 limiter.acquire()
                 data = client.get_category(device_name=ifixit_title, params=None)
                 repairability_score = data.get("repairability_score")
-                manufacturer = next(
-                    (
-                        entry.get("value")
-                        for entry in data.get("info", [])
-                        if entry.get("name") == "Device Brand"
-                    ),
-                    None,
-                )
+                manufacturer = None
+                for entry in data.get("info") or []:
+                    if entry.get("name") == "Device Brand":
+                        manufacturer = entry.get("value")
+                        break
 
                 repair_link = f"https://www.ifixit.com/Device/{ifixit_title}"
                 return (
@@ -453,7 +509,7 @@ def print_device_data(
 
     max_workers = 8
     requests_per_second = 4
-    limiter = _RateLimiter(rate_per_sec=requests_per_second)
+    limiter = rate_limiter or _RateLimiter(rate_per_sec=requests_per_second)
 
     results: list[tuple[str, str, Optional[float], Optional[str], Optional[str], Optional[str]]] = []
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
@@ -476,7 +532,7 @@ def print_device_data(
                 logger.info("- %s (%s)", name, title)
         logger.info("Repairability scores for devices:")
         for name, title, score, _brand, _link in with_score:
-            teardown_items = teardown_guides.get(_DeviceDataUtils.normalize_key(name), [])
+            teardown_items = teardown_guides_for(name)
             if teardown_items:
                 titles_and_urls = [
                     f"{g['title']} ({', '.join(g.get('tags', []))}) : {g['url']}"
@@ -488,11 +544,10 @@ def print_device_data(
         logger.info("Summary:")
         logger.info("- Devices with a repairability score: %d", len(with_score))
         logger.info("- Total devices processed: %d", len(results))
-        matched = sum(
-            1 for name, _t, _s, _b, _l in with_score if _DeviceDataUtils.normalize_key(name) in teardown_guides)
+        matched = sum(1 for name, _t, _s, _b, _l in with_score if teardown_guides_for(name))
         logger.info("- Devices with matched teardown URLs: %d", matched)
 
-    def create_device_entry(name, title, score, brand, link, teardown_guides):
+    def create_device_entry(name, title, score, brand, link):
         return {
             "name": name,
             "title": title,
@@ -506,10 +561,10 @@ def print_device_data(
                     "tags": guide.get("tags", []),
                     "difficulty": guide.get("difficulty"),
                 }
-                for guide in teardown_guides.get(_DeviceDataUtils.normalize_key(name), [])
+                for guide in teardown_guides_for(name)
             ],
             "france_repairability_score": french_scraper.match_device_to_french_score(
-                {"name": name, "title": title, "brand": brand}),
+                french_scraper.annotate_device({"name": name, "title": title, "brand": brand})),
         }
 
     print_outputs()
@@ -521,14 +576,14 @@ def print_device_data(
             existing_keys = set()
             all_entries = []
             for name, title, score, brand, link, _err in results:
-                all_entries.append(create_device_entry(name, title, score, brand, link, teardown_guides))
+                all_entries.append(create_device_entry(name, title, score, brand, link))
                 existing_keys.add((name, title))
 
             # Also include devices that failed (e.g., 404) so they appear as well
             # without duplicating already present entries from results list above.
             for name, title in without_score:
                 if (name, title) not in existing_keys:
-                    all_entries.append(create_device_entry(name, title, None, None, None, teardown_guides))
+                    all_entries.append(create_device_entry(name, title, None, None, None))
 
             all_entries.sort(key=lambda d: ((d.get("brand") or ""), d["name"], d["title"]))
 
@@ -575,7 +630,7 @@ def generate_rubric_json(client: IFixitAPIClient, output_file: str = "rubric.jso
             if rate_limiter:
                 rate_limiter.acquire()
             html = client.get_wiki_page_html(title)
-            return BeautifulSoup(html, 'html.parser')
+            return BeautifulSoup(html, 'lxml')
         except requests.RequestException as e:
             logger.error(f"Failed to fetch wiki page for version {version}: {e}")
             return None
@@ -701,7 +756,7 @@ def get_rubric_versions_for_devices(client) -> list[dict[str, str]]:
     html_new = client.get_repairability_page_html(old_devices=False)
     html_old = client.get_repairability_page_html(old_devices=True)
     for html in [html_new, html_old]:
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         for device_block in soup.find_all("div",
                                           class_="wp-block-column is-layout-flow wp-block-column-is-layout-flow"):
             h1 = device_block.find("h1", class_="wp-block-heading")
@@ -760,6 +815,11 @@ async def main_async() -> None:
         default="france_devices_with_scores.json",
         help="Output file for French repairability scores",
     )
+    parser.add_argument(
+        "--french-cache",
+        default=None,
+        help="SQLite file caching French listing pages for a day (requires aiohttp-client-cache)",
+    )
     parser.add_argument(
         "--generate-rubric",
         action="store_true",
@@ -772,14 +832,14 @@ async def main_async() -> None:
     )
     args = parser.parse_args()
 
-    client = IFixitAPIClient(log_level=log_level, proxy=True, raise_for_status=False)
     rate_limiter = _RateLimiter(rate_per_sec=4)
+    client = IFixitAPIClient(log_level=log_level, proxy=True, raise_for_status=False, rate_limiter=rate_limiter)
 
     # Fetch French repairability scores
     logger.info("Fetching French repairability scores from indicereparabilite.fr...")
-    french_scraper = FrenchRepairabilityScraper()
-    french_scores = await french_scraper.get_french_repairability_scores()
-    write_json_atomic(args.french_scores_output, french_scores)
+    async with FrenchRepairabilityScraper(cache=args.french_cache) as french_scraper:
+        french_scores = await french_scraper.get_french_repairability_scores()
+    write_json_atomic(args.french_scores_output, [dataclasses.asdict(smartphone) for smartphone in french_scores])
     logger.info(f"Saved French repairability scores to {args.french_scores_output}")
 
     if args.generate_rubric:
@@ -797,7 +857,7 @@ async def main_async() -> None:
         logger.warning("No demo devices found.")
         return
 
-    print_device_data(client, devices, french_scraper, args.scores_output)
+    print_device_data(client, devices, french_scraper, args.scores_output, rate_limiter=rate_limiter)
 
 
 def run_main():
@@ -1,232 +1,448 @@
 import asyncio
+import functools
 import logging
 import os
+import random
 import re
-from typing import Optional, Any
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass
+from typing import Optional, Any, Self
 
 import aiohttp
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
+
+from rate_limiter import _RateLimiter
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-_RE_SEPARATORS = re.compile(r"[–—\-_/|:]+")
-_RE_PARENS = re.compile(r"\([^)]*\)")
-_RE_NETWORK = re.compile(r"\b(?:[45]\s*G)\b", flags=re.IGNORECASE)
+# Separators are unified to spaces with one str.translate call before any regex runs.
+_SEPARATORS_TO_SPACE = str.maketrans(dict.fromkeys("–—-_/|:", " "))
+# Single pass for everything else replaced by a space before the memory cut: parenthesized content
+# and standalone '4G'/'5G'. The network token may span spaces or parentheses (which used to be
+# removed first) and is delimited by letters/digits only, so '_' counts as a separator.
+_RE_SCRUB = re.compile(r"\([^)]*\)"
+                       r"|(?<![^\W_])[45](?:\s|\([^)]*\))*G(?![^\W_])",
+                       flags=re.IGNORECASE)
 # Matches memory like "128GO", "256 Go", "64Gb", etc., capturing the start to cut the string.
 _RE_MEMORY = re.compile(r"\b\d+\s*(?:GO|Go|go|GB|Gb|gb)\b")
-_RE_SPACES = re.compile(r"\s+")
 _RE_WORDS = re.compile(r"\b(?:red|blue|green|yellow|orange|purple|black|white|gray|brown|pink|violet|vert|forêt"
-                       r"|tropical|gris|interstellaire|blanc|glacier|noir|de minuit|polaire|bleu|corail|rouge|boréal"
-                       r"|cosmos|céleste|silver|gold|ls deep|light|polar|lavande|argent|cyan)\b",
+                       r"|tropical|gris|interstellaire|blanc|glacier|noir|de\s+minuit|polaire|bleu|corail|rouge|boréal"
+                       r"|cosmos|céleste|silver|gold|ls\s+deep|light|polar|lavande|argent|cyan)\b",
                        flags=re.IGNORECASE)
+_RE_IPHONE_SE = re.compile(r"\biphone\s*se\b", flags=re.IGNORECASE)
+_RE_REDMI_NOTE_S = re.compile(r"\bredmi\s+note\s+(\d+)\s*s\b", flags=re.IGNORECASE)
+# Both canonical-name special cases in one scan: group 1 is iPhone SE, group 2 the Redmi Note number.
+_RE_SPECIAL_NAMES = re.compile(f"({_RE_IPHONE_SE.pattern})|{_RE_REDMI_NOTE_S.pattern}", flags=re.IGNORECASE)
+_RE_SMARTPHONE_PREFIX = re.compile(r"^\s*Smartphone[\s\-]*", flags=re.IGNORECASE)
+_RE_PAGE_NUMBER = re.compile(r"/page/(\d+)/")
+_RE_PAREN_CONTENT = re.compile(r"\(([^)]*)\)")
+_RE_MODEL_CODE_JUNK = re.compile(r"[\s\-_/.]+")
+
+# Maximum number of open connections to the site.
+_MAX_CONCURRENT_PAGES = 20
+# Listing pages requested per second (token bucket, bursts up to this many).
+_PAGES_PER_SECOND = 10
+# Size of the body chunks fed to the HTML parser while a page downloads.
+_CHUNK_SIZE = 32 * 1024
+# The site serves UTF-8; assumed when a response does not declare a charset instead of sniffing the body.
+_PAGE_ENCODING = "utf-8"
+# Lifetime of listing pages in the optional on-disk cache, so reruns within a day skip the downloads.
+_CACHE_EXPIRE_AFTER = 24 * 60 * 60
+# Upper bound in seconds for the wait between fetch retries, including server-requested Retry-After delays.
+_MAX_RETRY_DELAY = 30
+_TIMEOUT = aiohttp.ClientTimeout(total=30, sock_connect=5, sock_read=10)
+_HEADERS = {"User-Agent": "ifixit-repair-score-site (+https://github.com/NoJokeFNA/ifixit-repair-score-site)"}
+
+
+def _has_class(name: str) -> str:
+    """XPath predicate matching a single class token, like the CSS `.name` selector."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+_XP_PRODUCTS = etree.XPath(f"//ul[{_has_class('products')}]//li[{_has_class('product')}]")
+_XP_SCORE = etree.XPath(f".//div[{_has_class('footer')}]//*[{_has_class('price')}]//h4//span")
+_XP_NAME = etree.XPath(f".//h4[{_has_class('card-title')}]//a")
+_XP_DESCRIPTION_ROWS = etree.XPath(f".//div[{_has_class('card-description')}]//table//tbody//tr")
+_XP_STRONG = etree.XPath(".//strong")
+# Pagination link targets plus the current page's number, as plain strings in one traversal.
+_XP_PAGINATION = etree.XPath(
+    f"//ul[{_has_class('page-numbers')}]//li//a[{_has_class('page-numbers')}]/@href"
+    f" | //ul[{_has_class('page-numbers')}]//li//span[{_has_class('page-numbers')} and {_has_class('current')}]/text()"
+)
+
+
+def _model_key(code: Optional[str]) -> str:
+    """Returns a lookup key for a model code ('SM-S918B' -> 'SMS918B'), or '' if it does not look like one."""
+    key = _RE_MODEL_CODE_JUNK.sub("", code or "").upper()
+    if any(c.isalpha() for c in key) and any(c.isdigit() for c in key):
+        return key
+    return ""
+
+
+def _first(elements: list) -> Any:
+    """Returns the first element of an XPath result, or None."""
+    return elements[0] if elements else None
+
+
+def _text(element: Any) -> str:
+    """Returns the element text with each fragment stripped, like BeautifulSoup's get_text(strip=True)."""
+    return "".join(t.strip() for t in element.itertext())
+
+
+def _most_common_score(scores: list[Optional[float]]) -> Optional[float]:
+    """Returns the most frequent score, the one agreed on by most rows sharing a name or model.
+
+    Ties go to the score seen first.
+    """
+    # A single candidate is decisive, no need to compute the mode.
+    if len(scores) == 1:
+        return scores[0]
+    return Counter(scores).most_common(1)[0][0]
+
+
+@functools.lru_cache(maxsize=8192)
+def _name_key(normalized_name: str) -> str:
+    """Returns the lookup key for a normalized name, ignoring case, accents, spacing and punctuation.
+
+    '+' is kept since it distinguishes models ('Galaxy S23' vs 'Galaxy S23+').
+    """
+    decomposed = unicodedata.normalize("NFKD", normalized_name.casefold())
+    return "".join(c for c in decomposed if c.isalnum() or c == "+")
+
+
+@functools.lru_cache(maxsize=8192)
+def _normalize_xiaomi_redmi_note_s(name: str) -> Optional[str]:
+    """Returns the canonical 'Xiaomi Redmi Note <n> S' name, or None if the name is not such a variant."""
+    m = _RE_REDMI_NOTE_S.search(name)
+    if m:
+        return f"Xiaomi Redmi Note {m.group(1)} S"
+    return None
+
+
+@functools.lru_cache(maxsize=8192)
+def _normalize_device_name(raw_name: str) -> str:
+    """Normalize a device name to a clean model designation.
+
+    Rules:
+      * Remove anything inside parentheses.
+      * Remove standalone '4G'/'5G'.
+      * If a memory token like '128 Go'/'128GO'/'128GB' exists, cut the string from
+        the start of that number to the end (i.e., keep the left part only).
+      * Unify separators to spaces, collapse spaces, Title Case.
+      * Keep the special iPhone SE handling.
+
+    Args:
+      raw_name: Original device name.
+
+    Returns:
+      Normalized device name.
+    """
+    if not raw_name:
+        return ""
+
+    s = raw_name.strip()
+
+    # Special-case iPhone SE and Redmi Note S (keep as canonical names); iPhone SE wins if both appear.
+    special_match = _RE_SPECIAL_NAMES.search(s)
+    if special_match:
+        if special_match.group(1) or _RE_IPHONE_SE.search(s, special_match.end()):
+            return "Apple iPhone SE"
+        return f"Xiaomi Redmi Note {special_match.group(2)} S"
+
+    # Normalize separators, then remove parentheses content and drop standalone 4G/5G tokens.
+    s = _RE_SCRUB.sub(" ", s.translate(_SEPARATORS_TO_SPACE))
+
+    # If a memory marker exists (e.g., '128 Go' / '128GO' / '128GB'), cut from there.
+    mem_match = _RE_MEMORY.search(s)
+    if mem_match:
+        s = s[: mem_match.start()]
+
+    # Remove color words (multi-word ones tolerate any run of spaces, so no collapse is needed first).
+    s = _RE_WORDS.sub(" ", s)
+
+    # Collapse spaces and Title Case for readability ('PRO' -> 'Pro', etc.).
+    s = " ".join(w.capitalize() for w in s.split())
+    return s.replace("Iphone", "iPhone")
+
+
+@dataclass(slots=True)
+class Smartphone:
+    """A smartphone listed on indicereparabilite.fr with its repairability score."""
+
+    name: str
+    normalized_name: str
+    brand: Optional[str]
+    model: Optional[str]
+    last_updated: Optional[str]
+    repairability_score: Optional[float]
 
 
 class FrenchRepairabilityScraper:
-    """Class to scrape and match French repairability scores from indicereparabilite.fr."""
+    """Class to scrape and match French repairability scores from indicereparabilite.fr.
 
-    def __init__(self):
+    Args:
+        cache: SQLite file caching listing pages for a day, or None to disable (default: None).
+            Requires aiohttp-client-cache. The cache stores and replays whole bodies, so with it
+            enabled pages are buffered in memory instead of streamed into the parser.
+    """
+
+    def __init__(self, cache: Optional[str] = None):
+        self._cache_path = cache
         self.http_proxy = os.getenv('HTTP_PROXY')
         self.https_proxy = os.getenv('HTTPS_PROXY')
-        self.french_scores = []
+        self.french_scores: list[Smartphone] = []
+        self._france_score_map: dict[str, Optional[float]] = {}
+        self._france_model_map: dict[str, Optional[float]] = {}
+        self._match_cache: dict[tuple[str, Optional[str], Optional[str], Optional[str]], Optional[float]] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def fetch_page(
+            self, session: aiohttp.ClientSession, url: str, retries: int = 3) -> Optional[lxml.html.HtmlElement]:
+        """Fetch a page with retries and error handling.
+
+        The body is fed to lxml chunk by chunk as it arrives, so parsing overlaps the
+        download and the full HTML is never buffered as one string. With the on-disk cache
+        enabled, the cache buffers each body whole and the chunks come from that copy.
 
-    async def fetch_page(self, session: aiohttp.ClientSession, url: str, retries: int = 3) -> Optional[str]:
-        """Fetch a page with retries and error handling."""
+        Returns:
+            The root element of the parsed page, or None if it could not be fetched.
+        """
         proxy = self.https_proxy if url.startswith(
             'https://') and self.https_proxy else self.http_proxy if url.startswith(
             'http://') and self.http_proxy else None
-        for _ in range(retries):
+        attempt = 0
+        for attempt in range(1, retries + 1):
+            # Exponential backoff with jitter, so retries of concurrent pages do not arrive in lockstep.
+            delay = min(_MAX_RETRY_DELAY, 2 ** (attempt - 1)) + random.uniform(0, 0.5)
             try:
-                async with session.get(url, proxy=proxy, timeout=10) as response:
+                async with session.get(url, proxy=proxy) as response:
                     if response.status == 200:
-                        html = await response.text()
+                        parser = lxml.html.HTMLParser(encoding=response.charset or _PAGE_ENCODING)
+                        async for chunk in response.content.iter_chunked(_CHUNK_SIZE):
+                            parser.feed(chunk)
+                        root = parser.close()
                         logger.debug(f"Fetched {url} successfully")
-                        return html
+                        return root
                     logger.error(f"Failed to fetch {url}: Status {response.status}")
+                    if 400 <= response.status < 500 and response.status != 429:
+                        break  # Client errors other than rate limiting will not go away on retry.
+                    retry_after = response.headers.get("Retry-After", "")
+                    if response.status in (429, 503) and retry_after.isdigit():
+                        delay = max(delay, min(_MAX_RETRY_DELAY, int(retry_after)))
             except aiohttp.ClientError as e:
                 logger.error(f"Error fetching {url}: {e}")
-            await asyncio.sleep(1)
-        logger.warning(f"Failed to fetch {url} after {retries} attempts")
+            except etree.LxmlError as e:
+                logger.error(f"Failed to parse {url}: {e}")
+            if attempt < retries:
+                await asyncio.sleep(delay)
+        logger.warning(f"Failed to fetch {url} after {attempt} attempts")
         return None
 
-    async def parse_smartphones(self, html: str) -> list[dict[str, Any]]:
-        soup = BeautifulSoup(html, "html.parser")
-        products = soup.select("ul.products li.product")
+    def parse_smartphones(self, html: str | bytes) -> list[Smartphone]:
+        """Parse the smartphones out of a listing page's HTML.
+
+        Raw bytes are preferred: lxml then decodes them once using the page's declared charset.
+        """
+        return self._parse_products(lxml.html.fromstring(html))
+
+    def _parse_products(self, root: lxml.html.HtmlElement) -> list[Smartphone]:
+        """Extract the smartphones listed in a parsed listing page."""
+        products = _XP_PRODUCTS(root)
         smartphones = []
         for p in products:
-            score_elem = p.select_one("div.footer .price h4 span")
+            score_elem = _first(_XP_SCORE(p))
             repairability_score = None
-            if score_elem:
-                score_text = score_elem.get_text(strip=True)
+            if score_elem is not None:
+                name_node = _first(_XP_NAME(p))
+                name = _text(name_node) if name_node is not None else None
+                score_text = _text(score_elem)
                 try:
                     score_cleaned = score_text.replace('€', '').replace(',', '.')
                     repairability_score = float(score_cleaned)
                 except ValueError:
-                    product_name = p.select_one("h4.card-title a")
-                    product_name = product_name.get_text(strip=True) if product_name else "Unknown"
-                    logger.warning(f"Failed to parse score '{score_text}' for product {product_name}")
-
-                name = (name.get_text(strip=True) if (name := p.select_one("h4.card-title a")) else None)
-                name = re.sub(r'^\s*Smartphone[\s\-]*', '', name or '', flags=re.IGNORECASE)
-                brand = (brand.get_text(strip=True) if (brand := p.select_one(
-                    "div.card-description table tbody tr:nth-child(1) strong")) else None)
-                model = (model.get_text(strip=True) if (model := p.select_one(
-                    "div.card-description table tbody tr:nth-child(2) strong")) else None)
-                last_updated = (last_updated.get_text(strip=True) if (last_updated := p.select_one(
-                    "div.card-description table tbody tr:nth-child(3) strong")) else None)
-                smartphone = {
-                    "name": name,
-                    "normalized_name": self.normalize_device_name(name),
-                    "brand": brand,
-                    "model": model,
-                    "last_updated": last_updated,
-                    "repairability_score": repairability_score,
-                }
+                    logger.warning(f"Failed to parse score '{score_text}' for product {name or 'Unknown'}")
+
+                name = _RE_SMARTPHONE_PREFIX.sub('', name or '')
+                # Brand, model and last update are the first three description rows.
+                cells = [_text(strong) if (strong := _first(_XP_STRONG(row))) is not None else None
+                         for row in _XP_DESCRIPTION_ROWS(p)[:3]]
+                brand, model, last_updated = cells + [None] * (3 - len(cells))
+                smartphone = Smartphone(
+                    name=name,
+                    normalized_name=self.normalize_device_name(name),
+                    brand=brand,
+                    model=model,
+                    last_updated=last_updated,
+                    repairability_score=repairability_score,
+                )
                 smartphones.append(smartphone)
                 logger.debug(f"Parsed {len(smartphones)} smartphones from page")
         return smartphones
 
-    async def get_total_pages(self, session: aiohttp.ClientSession) -> int:
-        """Determine the total number of pages dynamically."""
+    async def get_total_pages(
+            self, session: aiohttp.ClientSession) -> tuple[int, Optional[list[Smartphone]]]:
+        """Determine the total number of pages dynamically.
+
+        The first page is fetched to read the pagination widget, so its smartphones are
+        returned as well to avoid downloading it twice.
+
+        Returns:
+            The total number of pages and the smartphones of page 1 (None if it could not be fetched).
+        """
         url = "https://www.indicereparabilite.fr/appareils/smartphone/page/1/"
-        html = await self.fetch_page(session, url)
-        if not html:
+        root = await self.fetch_page(session, url)
+        if root is None:
             logger.warning("Could not fetch first page to determine total pages. Defaulting to 38.")
-            return 38
-        soup = BeautifulSoup(html, "html.parser")
-        pagination_items = soup.select("ul.page-numbers li a.page-numbers, ul.page-numbers li span.page-numbers")
-        logger.debug(f"Found {len(pagination_items)} pagination items")
+            return 38, None
+        first_page_smartphones = await asyncio.to_thread(self._parse_products, root)
+        pagination_values = _XP_PAGINATION(root)
+        logger.debug(f"Found {len(pagination_values)} pagination items")
         page_numbers = []
-        for item in pagination_items:
-            if item.name == "a":
-                href = item.get("href", "")
-                match = re.search(r'/page/(\d+)/', href)
-                if match:
-                    page_numbers.append(int(match.group(1)))
-            elif item.name == "span" and "current" in item.get("class", []):
-                try:
-                    page_numbers.append(int(item.get_text(strip=True)))
-                except ValueError:
-                    continue
-        return max(page_numbers) if page_numbers else 38
+        for value in pagination_values:
+            match = _RE_PAGE_NUMBER.search(value)
+            if match:
+                page_numbers.append(int(match.group(1)))
+                continue
+            try:
+                page_numbers.append(int(value))
+            except ValueError:
+                continue
+        return (max(page_numbers) if page_numbers else 38), first_page_smartphones
 
-    async def get_smartphones_from_page(self, session: aiohttp.ClientSession, page_number: int) -> list[dict[str, Any]]:
+    async def get_smartphones_from_page(self, session: aiohttp.ClientSession, page_number: int) -> list[Smartphone]:
         """Fetch and parse smartphones from a single page."""
         url = f"https://www.indicereparabilite.fr/appareils/smartphone/page/{page_number}/"
         logger.debug(f"Fetching page {page_number}...")
-        html = await self.fetch_page(session, url)
-        if html:
-            return await self.parse_smartphones(html)
+        root = await self.fetch_page(session, url)
+        if root is not None:
+            # Extraction is CPU-bound; keep it off the event loop so other downloads keep draining.
+            return await asyncio.to_thread(self._parse_products, root)
         return []
 
-    async def get_french_repairability_scores(self) -> list[dict]:
-        async with aiohttp.ClientSession() as session:
-            total_pages = await self.get_total_pages(session)
-            logger.info(f"Found {total_pages} pages to scrape.")
-            semaphore = asyncio.Semaphore(5)
-
-            async def limited_fetch(page: int) -> list[dict[str, Any]] | None:
-                async with semaphore:
-                    await asyncio.sleep(0.5)
-                    return await self.get_smartphones_from_page(session, page)
-
-            tasks = [limited_fetch(page) for page in range(1, total_pages + 1)]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            self.french_scores = []
-            for result in results:
-                if isinstance(result, list):
-                    self.french_scores.extend(result)
-                else:
-                    logger.error(f"Error in task: {result}")
-            logger.info(f"Total smartphones found: {len(self.french_scores)}")
-            self.french_scores.sort(key=lambda x: x.get("name", "").lower())
-            return self.french_scores
-
-    def match_device_to_french_score(self, device: dict) -> Optional[float]:
-        """Match a device to its French repairability score using normalization logic"""
-        france_score_map = {}
-        for french_device in self.french_scores:
-            norm_name = french_device.get("normalized_name", "")
-            score = french_device.get("repairability_score")
-            if norm_name in france_score_map:
-                france_score_map[norm_name].append(score)
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Returns the scraper's HTTP session, opening it on first use so repeated scrapes share its pool."""
+        if self._session is None or self._session.closed:
+            # Keep-alive pool sized to the page concurrency so every page reuses an open connection.
+            connector = aiohttp.TCPConnector(limit=_MAX_CONCURRENT_PAGES, limit_per_host=_MAX_CONCURRENT_PAGES,
+                                             ttl_dns_cache=300, keepalive_timeout=60)
+            if self._cache_path:
+                from aiohttp_client_cache import CachedSession, SQLiteBackend
+
+                cache = SQLiteBackend(self._cache_path, expire_after=_CACHE_EXPIRE_AFTER)
+                self._session = CachedSession(cache=cache, connector=connector, headers=_HEADERS, timeout=_TIMEOUT)
             else:
-                france_score_map[norm_name] = [score]
-
-        normalized_device_name = self.normalize_device_name(device.get("name", ""))
-        possible_scores = france_score_map.get(normalized_device_name)
-        if not possible_scores:
-            return None
-
-        try:
-            most_common_score = max(set(possible_scores), key=possible_scores.count)
-        except Exception:
-            most_common_score = possible_scores[0]
+                self._session = aiohttp.ClientSession(connector=connector, headers=_HEADERS, timeout=_TIMEOUT)
+        return self._session
+
+    async def close(self) -> None:
+        """Close the HTTP session, if one was opened."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def get_french_repairability_scores(self) -> list[Smartphone]:
+        session = await self._get_session()
+        total_pages, first_page_smartphones = await self.get_total_pages(session)
+        logger.info(f"Found {total_pages} pages to scrape.")
+        first_page = 1 if first_page_smartphones is None else 2
+        limiter = _RateLimiter(rate_per_sec=_PAGES_PER_SECOND)
+
+        async def limited_fetch(page: int) -> list[Smartphone] | None:
+            await limiter.acquire_async()
+            return await self.get_smartphones_from_page(session, page)
+
+        tasks = [limited_fetch(page) for page in range(first_page, total_pages + 1)]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        self.french_scores = list(first_page_smartphones or [])
+        for result in results:
+            if isinstance(result, list):
+                self.french_scores.extend(result)
+            else:
+                logger.error(f"Error in task: {result}")
+        logger.info(f"Total smartphones found: {len(self.french_scores)}")
+        self.french_scores.sort(key=lambda x: x.name.lower())
+        self._build_index()
+        return self.french_scores
 
-        return most_common_score
+    def _build_index(self) -> None:
+        """Index the scraped scores by name key and model code so matching does not rescan them.
 
-    def normalize_device_name(self, raw_name: str) -> str:
-        """Normalize a device name to a clean model designation.
-
-        Rules:
-          * Remove anything inside parentheses.
-          * Remove standalone '4G'/'5G'.
-          * If a memory token like '128 Go'/'128GO'/'128GB' exists, cut the string from
-            the start of that number to the end (i.e., keep the left part only).
-          * Unify separators to spaces, collapse spaces, Title Case.
-          * Keep the special iPhone SE handling.
+        Each index maps straight to the most common score of its rows, so a match is a single lookup.
+        Names are indexed by `_name_key` of their normalized form, which stays the display name.
+        """
+        scores_by_name: dict[str, list[Optional[float]]] = {}
+        scores_by_model: dict[str, list[Optional[float]]] = {}
+        self._match_cache = {}
+        for french_device in self.french_scores:
+            score = french_device.repairability_score
+            scores_by_name.setdefault(_name_key(french_device.normalized_name), []).append(score)
+            model_key = _model_key(french_device.model)
+            if model_key:
+                scores_by_model.setdefault(model_key, []).append(score)
+        self._france_score_map = {name: _most_common_score(scores) for name, scores in scores_by_name.items()}
+        self._france_model_map = {key: _most_common_score(scores) for key, scores in scores_by_model.items()}
+
+    def _matching_model_key(self, device: dict) -> Optional[str]:
+        """Find the device's model code, or a model code in parentheses in its name, among the French models."""
+        name = device.get("name") or ""
+        for code in (device.get("model"), *_RE_PAREN_CONTENT.findall(name)):
+            model_key = _model_key(code)
+            if model_key and model_key in self._france_model_map:
+                return model_key
+        return None
 
-        Args:
-          raw_name: Original device name.
+    def annotate_device(self, device: dict) -> dict:
+        """Store the device's normalized name on it, so matching it later skips normalization.
 
         Returns:
-          Normalized device name.
+            The same device dict.
         """
-        if not raw_name:
-            return ""
-
-        s = raw_name.strip()
-
-        # Special-case iPhone SE (keep as a canonical name).
-        if re.search(r"\biphone\s*se\b", s, flags=re.IGNORECASE):
-            return "Apple iPhone SE"
-
-        xiaomi_match = re.search(r'(?i)\bredmi\s+note\s+(\d+)\s*s\b', s, flags=re.IGNORECASE)
-        if xiaomi_match:
-            return f"Xiaomi Redmi Note {xiaomi_match.group(1)} S"
-
-        # Remove parentheses content first.
-        s = _RE_PARENS.sub(" ", s)
-
-        # Normalize separators to spaces early.
-        s = _RE_SEPARATORS.sub(" ", s)
-
-        # Remove standalone 4G/5G tokens.
-        s = _RE_NETWORK.sub(" ", s)
-
-        # If a memory marker exists (e.g., '128 Go' / '128GO' / '128GB'), cut from there.
-        mem_match = _RE_MEMORY.search(s)
-        if mem_match:
-            s = s[: mem_match.start()]
-
-        # Collapse spaces and trim.
-        s = _RE_SPACES.sub(" ", s).strip()
+        device["normalized_name"] = self.normalize_device_name(device.get("name", ""))
+        return device
 
-        # Remove color words.
-        s = _RE_WORDS.sub(" ", s)
-
-        # Title Case for readability ('PRO' -> 'Pro', etc.).
-        s = " ".join(w.capitalize() for w in s.split())
+    def match_device_to_french_score(self, device: dict) -> Optional[float]:
+        """Match a device to its French repairability score using normalization logic"""
+        # Only the name, its precomputed normalization, the model and the brand take part in
+        # matching, so results are cached on those.
+        key = (device.get("name", ""), device.get("normalized_name"), device.get("model"), device.get("brand"))
+        if key not in self._match_cache:
+            self._match_cache[key] = self._match_score(device)
+        return self._match_cache[key]
+
+    def _match_score(self, device: dict) -> Optional[float]:
+        normalized_name = device.get("normalized_name")
+        if normalized_name is None:
+            normalized_name = self.normalize_device_name(device.get("name", ""))
+        name_key = _name_key(normalized_name)
+        if name_key in self._france_score_map:
+            return self._france_score_map[name_key]
+        model_key = self._matching_model_key(device)
+        if model_key:
+            return self._france_model_map[model_key]
+        brand = device.get("brand")
+        if name_key and brand:
+            # French names carry the brand ('Samsung Galaxy S23'); retry names that omit it ('Galaxy S23').
+            branded_key = _name_key(self.normalize_device_name(f"{brand} {device.get('name', '')}"))
+            if branded_key in self._france_score_map:
+                return self._france_score_map[branded_key]
+        return None
 
-        s = s.replace("Google  Pixel", "Google Pixel")  # in case double spaces slipped in
-        s = s.replace("Iphone", "iPhone")
-        return s
+    def normalize_device_name(self, raw_name: str) -> str:
+        """Normalize a device name to a clean model designation (see `_normalize_device_name`)."""
+        return _normalize_device_name(raw_name)
 
+    @staticmethod
     def normalize_xiaomi_redmi_note_s(name: str) -> Optional[str]:
         """
         Normalize Xiaomi Redmi Note S variants to a canonical name.
         """
-        m = re.search(r'(?i)\bredmi\s+note\s+(\d+)\s*s\b', name)
-        if m:
-            return f"Xiaomi Redmi Note {m.group(1)} S"
-        return None
+        return _normalize_xiaomi_redmi_note_s(name)
@@ -1,15 +1,58 @@
+import asyncio
 import logging
 import os
-from typing import Any, Dict, List, Optional
-
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Self, Tuple
+from urllib.parse import urlencode
+
+import aiohttp
 import requests
 import urllib3
 from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 from urllib3 import Retry
+from urllib3.util.request import ACCEPT_ENCODING
+
+from rate_limiter import _RateLimiter
+
+try:
+    from orjson import dumps as _json_dumps
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import dumps as _json_dumps_str
+    from json import loads as _json_loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return _json_dumps_str(obj, separators=(',', ':')).encode()
 
 logger = logging.getLogger(__name__)
 
 
+class _RetryAfterRetry(Retry):
+    """A urllib3 Retry that reports the headers of every 429 it retries or gives up on.
+
+    The callback sees the Retry-After of each throttled attempt, including the last one, while
+    running out of retries still raises as usual.
+    """
+
+    def __init__(self, *args, on_429: Optional[Callable[[Any], None]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.on_429 = on_429
+
+    def new(self, **kw: Any) -> Self:
+        # Retry copies itself after every attempt; carry the callback over to the copy.
+        return super().new(on_429=self.on_429, **kw)
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None) -> Self:
+        if response is not None and response.status == 429 and self.on_429 is not None:
+            self.on_429(response.headers)
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
 class IFixitAPIClient:
     """A Python client for the iFixit API v2.0.
 
@@ -26,6 +69,12 @@ class IFixitAPIClient:
         log_level: Logging level (default: logging.INFO).
         allow_http: Allow HTTP requests when using a proxy (default: False).
         raise_for_status: Raise exceptions for HTTP error responses (default: True).
+        pool_maxsize: Connections kept open per host for concurrent callers (default: 32).
+        cache: SQLite file caching GET responses for an hour, or None to disable (default: None).
+        low_overhead: Send API requests through urllib3 directly instead of requests (default: False).
+        static_ttl: Seconds reference data such as badges, categories and tags stays cached (default: 600).
+        response_ttl: Seconds GET responses are reused in memory, or None to disable (default: None).
+        rate_limiter: Limiter pacing the caller's requests, told about 429 Retry-After delays (default: None).
         wiki_html = client.get_wiki_page_html('Repairability_Scoring_Rubric_v1.0')
 
     Usage:
@@ -41,6 +90,22 @@ class IFixitAPIClient:
     WIKI_BASE_URL = 'https://www.ifixit.com/Wiki'
     REPAIRABILITY_URL = 'https://www.ifixit.com/repairability'
 
+    # URL templates of the hottest GET endpoints, filled in with % from `BASE_URL` at call time (so
+    # subclasses pointing elsewhere are honoured) and sent through `_get_url`.
+    _GUIDE_URL = '%s/guides/%s'
+    _GUIDE_TAGS_URL = '%s/guides/%s/tags'
+    _GUIDE_USERS_URL = '%s/guides/%s/users'
+
+    # Set once the first proxied client has silenced urllib3's InsecureRequestWarning.
+    _warnings_disabled = False
+
+    # Most GET responses kept when `response_ttl` is set; the oldest entry is evicted first.
+    _RESPONSE_CACHE_SIZE = 10_000
+
+    __slots__ = ('_headers', '_inflight', '_inflight_lock', '_pool', '_rate_limiter', '_response_cache',
+                 '_response_generation', '_response_lock', '_response_ttl', '_static_ttl', '_ttl_cache', 'app_id',
+                 'auth_token', 'proxy', 'raise_for_status', 'session', 'timeout')
+
     def __init__(
             self,
             auth_token: Optional[str] = None,
@@ -52,6 +117,12 @@ class IFixitAPIClient:
             proxy=False,
             allow_http: bool = False,
             raise_for_status: bool = True,
+            pool_maxsize: int = 32,
+            cache: Optional[str] = None,
+            low_overhead: bool = False,
+            static_ttl: float = 600,
+            response_ttl: Optional[float] = None,
+            rate_limiter: Optional[_RateLimiter] = None,
     ):
         """Initialize the client.
 
@@ -59,56 +130,141 @@ class IFixitAPIClient:
             auth_token: Authentication token for authorized requests.
             app_id: Optional app ID for the X-App-Id header.
             retries: Number of retries for failed requests.
-            backoff_factor: Backoff factor for retries.
+            backoff_factor: Backoff factor for retries, also used as the maximum random jitter in seconds.
             timeout: Request timeout in seconds.
-            log_level: Logging level (e.g., logging.DEBUG).
+            log_level: Level of this module's logger (e.g., logging.DEBUG).
             allow_http: Allow HTTP requests when using a proxy.
             raise_for_status: Raise exceptions for HTTP error responses.
             proxy: Use proxy settings from environment variables.
+            pool_maxsize: Connections kept open per host, so threads sharing the client
+                reuse them instead of opening new ones.
+            cache: Path of a SQLite file caching successful GET responses for an hour
+                (requires requests-cache). Only unauthenticated responses are stored.
+            low_overhead: Send API requests straight through a urllib3 PoolManager, skipping the
+                requests session machinery. Cannot be combined with `proxy` or `cache`; the HTML
+                page fetches always use the session.
+            static_ttl: Seconds to keep reference data (badges, categories, tags) in memory
+                before fetching it again; 0 always refetches. Any write drops it early, and error
+                responses are never kept.
+            response_ttl: Seconds to reuse GET responses from memory, keyed by URL and query, or
+                None to always fetch. Writes to a path drop cached responses under it and above
+                it, and responses marked `Cache-Control: no-store` are never kept. The raw body is
+                cached and decoded again for every hit, so callers may modify what they get back.
+            rate_limiter: The limiter the caller acquires before its requests. Whenever a request
+                gets a 429 with a Retry-After, the limiter holds back its tokens for that long so
+                the following requests don't hit the limit again.
+
+        Raises:
+            ValueError: If `low_overhead` is combined with `proxy` or `cache`.
         """
+        if low_overhead and (proxy or cache):
+            raise ValueError('low_overhead cannot be combined with proxy or cache')
         self.auth_token = auth_token
         self.app_id = app_id
         self.timeout = timeout
         self.proxy = proxy
         self.raise_for_status = raise_for_status
-        logging.basicConfig(level=log_level)
-
-        self.session = requests.Session()
-        retry_strategy = Retry(
+        self._static_ttl = static_ttl
+        self._ttl_cache: Dict[str, Tuple[float, requests.Response]] = {}
+        self._response_ttl = response_ttl
+        self._response_cache: Dict[Tuple[str, str], Tuple[float, requests.Response]] = {}
+        self._response_lock = threading.Lock()
+        # Bumped by every write, so a GET that was in flight during one does not cache its reply.
+        self._response_generation = 0
+        self._rate_limiter = rate_limiter
+        # In-flight GETs by key, with the write generation they started in.
+        self._inflight: Dict[Tuple[str, str], Tuple[int, Future]] = {}
+        self._inflight_lock = threading.Lock()
+        # Configuring handlers is left to the application; only this module's level is set.
+        logger.setLevel(log_level)
+
+        # API headers never change for a client, so they are built once. They are passed per API
+        # request rather than set on the session, which also fetches the HTML wiki pages.
+        self._headers = {
+            'Content-Type': 'application/json',
+            'Accept': 'application/json',
+        }
+        if self.auth_token:
+            self._headers['Authorization'] = f'api {self.auth_token}'
+        if self.app_id:
+            self._headers['X-App-Id'] = self.app_id
+
+        if cache:
+            import requests_cache
+
+            self.session = requests_cache.CachedSession(
+                cache_name=cache,
+                backend='sqlite',
+                expire_after=3600,
+                allowable_methods=('GET',),
+                stale_if_error=True,
+                # Never persist responses to authenticated requests.
+                filter_fn=lambda response: 'Authorization' not in response.request.headers,
+            )
+        else:
+            self.session = requests.Session()
+        # Offer every content coding urllib3 can decode here (zstd and br with the brotli/zstd
+        # extras installed) instead of requests' default gzip/deflate.
+        self.session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+
+        # Jitter spreads out retries from clients that failed together, and a server's
+        # Retry-After takes precedence over the computed backoff. Each 429's Retry-After is
+        # also passed on to the rate limiter, so the caller's following requests wait too.
+        retry_strategy = _RetryAfterRetry(
             total=retries,
             backoff_factor=backoff_factor,
-            status_forcelist=[429, 500, 502, 503, 504],
+            backoff_jitter=backoff_factor,
+            respect_retry_after_header=True,
+            status_forcelist=[408, 425, 429, 500, 502, 503, 504],
             allowed_methods=['HEAD', 'GET', 'OPTIONS', 'POST', 'PATCH', 'PUT',
-                             'DELETE']
+                             'DELETE'],
+            on_429=self._honor_retry_after,
         )
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=pool_maxsize,
+                              pool_maxsize=pool_maxsize, pool_block=False)
         # Mount adapters for retries regardless of proxy usage
         self.session.mount('https://', adapter)
         self.session.mount('http://', adapter)
 
-        if self.proxy:
-            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-            self.session.proxies = {
-                "http": os.getenv("HTTP_PROXY"),
-                "https": os.getenv("HTTPS_PROXY"),
-            }
-
-    def _build_headers(self) -> Dict[str, str]:
-        """Build headers for API requests.
+        self._pool: Optional[urllib3.PoolManager] = None
+        if low_overhead:
+            self._pool = urllib3.PoolManager(
+                num_pools=4,
+                maxsize=pool_maxsize,
+                retries=retry_strategy,
+                headers={**self._headers, 'Accept-Encoding': ACCEPT_ENCODING},
+                ca_certs=requests.certs.where(),
+            )
 
-        Returns:
-            Dict of headers.
-        """
-        headers = {
-            'Content-Type': 'application/json',
-            'Accept': 'application/json',
-        }
-        if self.auth_token:
-            headers['Authorization'] = f'api {self.auth_token}'
-        if self.app_id:
-            headers['X-App-Id'] = self.app_id
-        return headers
+        # TLS verification is decided once per client on the session; requests merges it into
+        # every call made through it.
+        self.session.verify = not self.proxy
+        if self.proxy:
+            if not IFixitAPIClient._warnings_disabled:
+                urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+                IFixitAPIClient._warnings_disabled = True
+            proxies = {scheme: os.environ.get(var) for scheme, var in
+                       (('http', 'HTTP_PROXY'), ('https', 'HTTPS_PROXY'))}
+            self.session.proxies = {scheme: url for scheme, url in proxies.items() if url}
+
+    def close(self) -> None:
+        """Close the underlying session and its pooled connections."""
+        self.session.close()
+        if self._pool is not None:
+            self._pool.clear()
+
+    def clear_cache(self) -> None:
+        """Drop the in-memory reference data and response caches, so the next calls hit the API."""
+        with self._response_lock:
+            self._ttl_cache.clear()
+            self._response_cache.clear()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     def _request(
             self,
@@ -120,6 +276,9 @@ class IFixitAPIClient:
     ) -> Any:
         """Make an API request.
 
+        Endpoint methods use the fixed-argument `_get`/`_post`/`_put`/`_patch`/`_delete`
+        helpers; this general form remains for other verbs and extra requests kwargs.
+
         Args:
             method: HTTP method (e.g., 'GET', 'POST').
             endpoint: API endpoint path.
@@ -134,32 +293,338 @@ class IFixitAPIClient:
             requests.exceptions.HTTPError: For HTTP errors.
             requests.exceptions.RequestException: For other request failures.
         """
-        url = f'{self.BASE_URL}/{endpoint.lstrip("/")}'
-        headers = self._build_headers()
-        logger.debug(f'Making {method} request to {url} with params={params}, '
-                     f'json={json}')
+        return self._decode_json(self._send(method, self._url(endpoint), params, json, kwargs))
+
+    def _request_with_headers(
+            self,
+            method: str,
+            endpoint: str,
+            params: Optional[Dict[str, Any]] = None,
+            json: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Any, CaseInsensitiveDict]:
+        """Make an API request, also returning the response headers.
+
+        Args:
+            method: HTTP method (e.g., 'GET', 'POST').
+            endpoint: API endpoint path.
+            params: Query parameters.
+            json: JSON payload for POST/PATCH/PUT.
+
+        Returns:
+            Tuple of the JSON response (or None) and the response headers.
+
+        Raises:
+            requests.exceptions.HTTPError: For HTTP errors.
+            requests.exceptions.RequestException: For other request failures.
+        """
+        response = self._send(method, self._url(endpoint), params, json)
+        return self._decode_json(response), response.headers
+
+    def _get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """Make a GET API request; see `_request` and `_shared_get`."""
+        return self._shared_get(self._url(endpoint), params)
+
+    def _get_url(self, url: str) -> Any:
+        """Make a GET API request to a complete URL, skipping the endpoint joining; see `_shared_get`."""
+        return self._shared_get(url)
+
+    def _get_static(self, endpoint: str) -> Any:
+        """Make a GET API request for reference data, reusing the response for `static_ttl` seconds.
+
+        The cached body is decoded again for every call, so callers may modify what they get back.
+
+        Args:
+            endpoint: API endpoint path.
+
+        Returns:
+            JSON response or None.
+
+        Raises:
+            requests.exceptions.HTTPError: For HTTP errors.
+            requests.exceptions.RequestException: For other request failures.
+        """
+        url = self._url(endpoint)
+        now = time.monotonic()
+        with self._response_lock:
+            entry = self._ttl_cache.get(url)
+            generation = self._response_generation
+        if entry is not None and now - entry[0] < self._static_ttl:
+            return self._decode_json(entry[1])
+        response, result = self._shared_request(url)
+        # With raise_for_status=False error replies come back as data; they must not outlive the call.
+        if 200 <= response.status_code < 300:
+            with self._response_lock:
+                if self._response_generation == generation:
+                    self._ttl_cache[url] = (now, response)
+        return result
+
+    def _shared_get(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """Make a GET API request, sharing it with identical calls already in flight; see `_shared_request`."""
+        return self._shared_request(url, params)[1]
+
+    def _shared_request(
+            self,
+            url: str,
+            params: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[requests.Response, Any]:
+        """Make a GET API request, sharing it with identical calls already in flight.
+
+        Threads asking for the same URL and query at the same time wait on the first one's
+        request instead of each sending their own, unless a write has happened since that
+        request started. With `response_ttl` set, a fresh cached
+        response is returned without any request at all. The shared response is decoded
+        separately for every caller, so each gets its own result to modify.
+
+        Args:
+            url: Absolute API URL.
+            params: Query parameters.
+
+        Returns:
+            Tuple of the response and the caller's own decoded JSON (or None).
+
+        Raises:
+            requests.exceptions.HTTPError: For HTTP errors.
+            requests.exceptions.RequestException: For other request failures.
+        """
+        key = (url, urlencode(sorted(params.items()), doseq=True) if params else '')
+        now = time.monotonic()
+        with self._response_lock:
+            entry = self._response_cache.get(key) if self._response_ttl is not None else None
+            generation = self._response_generation
+        if entry is not None and now - entry[0] < self._response_ttl:
+            return entry[1], self._decode_json(entry[1])
+
+        with self._inflight_lock:
+            inflight = self._inflight.get(key)
+            # A request that started before a write may return what the write replaced; don't join it.
+            if inflight is None or inflight[0] != generation:
+                future = Future()
+                inflight = self._inflight[key] = (generation, future)
+                owner = True
+            else:
+                future = inflight[1]
+                owner = False
+        if not owner:
+            response = future.result()
+            return response, self._decode_json(response)
 
         try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                headers=headers,
-                params=params,
-                json=json,
-                timeout=self.timeout,
-                verify=not self.proxy,
-                **kwargs,
-            )
+            response = self._send('GET', url, params)
+            result = self._decode_json(response)
+            if (self._response_ttl is not None and 200 <= response.status_code < 300
+                    and 'no-store' not in response.headers.get('Cache-Control', '')):
+                with self._response_lock:
+                    # A write since the lookup may have changed the resource; don't cache what came before it.
+                    if self._response_generation == generation:
+                        self._response_cache.pop(key, None)
+                        if len(self._response_cache) >= self._RESPONSE_CACHE_SIZE:
+                            del self._response_cache[next(iter(self._response_cache))]
+                        self._response_cache[key] = (now, response)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(response)
+            return response, result
+        finally:
+            with self._inflight_lock:
+                # A later caller may have replaced the entry with its own post-write request.
+                if self._inflight.get(key) is inflight:
+                    del self._inflight[key]
+
+    def _invalidate_responses(self, url: str) -> None:
+        """Drop cached responses for `url`, the paths below it, and the paths it sits under.
+
+        All reference data goes too: one write can change lists kept under other paths, such as a
+        new parent's children or the tag list.
+        """
+        with self._response_lock:
+            self._response_generation += 1
+            self._ttl_cache.clear()
+            stale = [key for key in self._response_cache
+                     if key[0] == url or key[0].startswith(url + '/') or url.startswith(key[0] + '/')]
+            for key in stale:
+                del self._response_cache[key]
+
+    def _post(self, endpoint: str, json: Optional[Dict[str, Any]] = None,
+              params: Optional[Dict[str, Any]] = None) -> Any:
+        """Make a POST API request; see `_request`."""
+        return self._decode_json(self._send('POST', self._url(endpoint), params, json))
+
+    def _put(self, endpoint: str, json: Optional[Dict[str, Any]] = None,
+             params: Optional[Dict[str, Any]] = None) -> Any:
+        """Make a PUT API request; see `_request`."""
+        return self._decode_json(self._send('PUT', self._url(endpoint), params, json))
+
+    def _patch(self, endpoint: str, json: Optional[Dict[str, Any]] = None,
+               params: Optional[Dict[str, Any]] = None) -> Any:
+        """Make a PATCH API request; see `_request`."""
+        return self._decode_json(self._send('PATCH', self._url(endpoint), params, json))
+
+    def _delete(self, endpoint: str, json: Optional[Dict[str, Any]] = None,
+                params: Optional[Dict[str, Any]] = None) -> Any:
+        """Make a DELETE API request; see `_request`."""
+        return self._decode_json(self._send('DELETE', self._url(endpoint), params, json))
+
+    def _url(self, endpoint: str) -> str:
+        """Join an endpoint path onto the API base URL."""
+        # Endpoints are written with a leading slash, so plain concatenation is the common path.
+        return self.BASE_URL + endpoint if endpoint.startswith('/') else f'{self.BASE_URL}/{endpoint}'
+
+    def _send(
+            self,
+            method: str,
+            url: str,
+            params: Optional[Dict[str, Any]] = None,
+            json: Optional[Dict[str, Any]] = None,
+            extra: Optional[Dict[str, Any]] = None,
+    ) -> requests.Response:
+        """Send an API request over the pool or session and check its status.
+
+        Args:
+            method: HTTP method.
+            url: Absolute API URL.
+            params: Query parameters.
+            json: JSON payload.
+            extra: Additional requests kwargs; these always go through the session.
+
+        Returns:
+            The response.
+
+        Raises:
+            requests.exceptions.HTTPError: For HTTP errors.
+            requests.exceptions.RequestException: For other request failures.
+        """
+        logger.debug('Making %s request to %s with params=%s, json=%s', method, url, params, json)
+        # Serialized here so the body goes out as bytes (orjson when installed); the API headers
+        # already declare application/json.
+        body = None if json is None else _json_dumps(json)
+        try:
+            if extra:
+                response = self.session.request(method, url, headers=self._headers, params=params,
+                                                data=body, timeout=self.timeout, **extra)
+            elif self._pool is not None:
+                response = self._pool_request(method, url, params, body)
+            else:
+                response = self.session.request(method, url, headers=self._headers, params=params,
+                                                data=body, timeout=self.timeout)
             if self.raise_for_status:
                 response.raise_for_status()
-            return response.json() if response.content else None
-        except requests.exceptions.HTTPError as e:
-            logger.error(f'HTTP error: {e.response.status_code} - '
-                         f'{e.response.text}')
-            raise
+            return response
         except requests.exceptions.RequestException as e:
-            logger.error(f'Request failed: {str(e)}')
+            self._log_request_error(e, url)
             raise
+        finally:
+            # A write may have changed what cached GETs of this path (or its parents) returned.
+            if method != 'GET':
+                self._invalidate_responses(url)
+
+    def _pool_request(
+            self,
+            method: str,
+            url: str,
+            params: Optional[Dict[str, Any]] = None,
+            body: Optional[bytes] = None,
+    ) -> requests.Response:
+        """Send a request through the low-overhead PoolManager.
+
+        The reply is wrapped in a `requests.Response` and urllib3 errors are re-raised as their
+        requests equivalents, so callers handle both transports the same way.
+
+        Returns:
+            The response, with its body already read.
+
+        Raises:
+            requests.exceptions.RequestException: For request failures.
+        """
+        if params:
+            # Like requests, leave out parameters whose value is None.
+            query = urlencode({k: v for k, v in params.items() if v is not None}, doseq=True)
+            if query:
+                url = f'{url}?{query}'
+        try:
+            pool_response = self._pool.request(method, url, body=body, timeout=self.timeout)
+        except urllib3.exceptions.MaxRetryError as e:
+            if isinstance(e.reason, urllib3.exceptions.ResponseError):
+                raise requests.exceptions.RetryError(e) from e
+            # NewConnectionError subclasses ConnectTimeoutError but is a refused connection.
+            if (isinstance(e.reason, urllib3.exceptions.ConnectTimeoutError)
+                    and not isinstance(e.reason, urllib3.exceptions.NewConnectionError)):
+                raise requests.exceptions.ConnectTimeout(e) from e
+            if isinstance(e.reason, urllib3.exceptions.SSLError):
+                raise requests.exceptions.SSLError(e) from e
+            if isinstance(e.reason, urllib3.exceptions.ReadTimeoutError):
+                raise requests.exceptions.ReadTimeout(e) from e
+            raise requests.exceptions.ConnectionError(e) from e
+        except urllib3.exceptions.HTTPError as e:
+            raise requests.exceptions.ConnectionError(e) from e
+
+        response = requests.Response()
+        response.status_code = pool_response.status
+        response.headers = CaseInsensitiveDict(pool_response.headers)
+        response.reason = pool_response.reason
+        response.url = url
+        response._content = pool_response.data
+        return response
+
+    def _honor_retry_after(self, headers: Any) -> None:
+        """Pass a 429 response's Retry-After (in seconds) on to the rate limiter, if there is one."""
+        retry_after = headers.get('Retry-After', '')
+        if self._rate_limiter is not None and retry_after.isdigit():
+            logger.warning('Rate limited by the API; holding requests for %s s', retry_after)
+            self._rate_limiter.inform_retry_after(int(retry_after))
+
+    @staticmethod
+    def _log_request_error(error: requests.exceptions.RequestException, target: str) -> None:
+        """Log a failed request, with at most 512 bytes of the error response body."""
+        response = error.response
+        if response is not None:
+            # The status leads, as 'HTTP error: 404', which fetch_device_data's Suppress404Filter looks for.
+            logger.error('HTTP error: %s for %s - %r', response.status_code, target, response.content[:512])
+        else:
+            logger.error('Request failed for %s: %s', target, error)
+
+    @staticmethod
+    def _fetch_bulk(fetch: Callable[[Any], Any], ids: Iterable[Any], max_workers: int) -> Dict[Any, Any]:
+        """Call `fetch` for each ID concurrently over the shared session.
+
+        Returns:
+            Dict mapping each ID, in input order, to its result or to the request exception it raised.
+        """
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            return {}
+        results: Dict[Any, Any] = {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(ids))) as executor:
+            futures = {item_id: executor.submit(fetch, item_id) for item_id in ids}
+            for item_id, future in futures.items():
+                try:
+                    results[item_id] = future.result()
+                except requests.exceptions.RequestException as e:
+                    results[item_id] = e
+        return results
+
+    @staticmethod
+    def _decode_json(response: requests.Response) -> Any:
+        """Decode a JSON response body straight from its bytes (with orjson when installed).
+
+        Returns:
+            The decoded JSON, or None for an empty body.
+
+        Raises:
+            requests.exceptions.JSONDecodeError: If the body is not valid JSON, as `response.json()` would.
+        """
+        # 204 and zero-length replies (typical for DELETEs) carry no body to read.
+        if response.status_code == 204 or response.headers.get('Content-Length') == '0':
+            return None
+        content = response.content
+        if not content:
+            return None
+        try:
+            return _json_loads(content)
+        except ValueError as e:
+            raise requests.exceptions.JSONDecodeError(getattr(e, 'msg', str(e)), response.text,
+                                                      getattr(e, 'pos', 0)) from e
 
     def get_wiki_page_html(self, title: str) -> str:
         """Fetch the raw HTML content of a wiki page.
@@ -175,22 +640,18 @@ class IFixitAPIClient:
             requests.exceptions.RequestException: For other request failures.
         """
         url = f'{self.WIKI_BASE_URL}/{title}'
-        logger.debug(f'Fetching wiki page HTML from {url}')
+        logger.debug('Fetching wiki page HTML from %s', url)
 
         try:
             response = self.session.get(
                 url=url,
                 timeout=self.timeout,
-                verify=not self.proxy,
             )
             if self.raise_for_status:
                 response.raise_for_status()
             return response.text
-        except requests.exceptions.HTTPError as e:
-            logger.error(f'HTTP error fetching wiki page {url}: {e.response.status_code} - {e.response.text}')
-            raise
         except requests.exceptions.RequestException as e:
-            logger.error(f'Request failed for wiki page {url}: {str(e)}')
+            self._log_request_error(e, f'wiki page {url}')
             raise
 
     def get_repairability_page_html(self, old_devices: bool = False) -> str:
@@ -208,22 +669,18 @@ class IFixitAPIClient:
         """
         title = ('smartphone-repairability-scores' if old_devices else 'legacy-smartphone-scores')
         url = f'{self.REPAIRABILITY_URL}/{title}'
-        logger.debug(f'Fetching repairability page HTML from {url}')
+        logger.debug('Fetching repairability page HTML from %s', url)
 
         try:
             response = self.session.get(
                 url=url,
                 timeout=self.timeout,
-                verify=not self.proxy,
             )
             if self.raise_for_status:
                 response.raise_for_status()
             return response.text
-        except requests.exceptions.HTTPError as e:
-            logger.error(f'HTTP error fetching repairability page {url}: {e.response.status_code} - {e.response.text}')
-            raise
         except requests.exceptions.RequestException as e:
-            logger.error(f'Request failed for repairability page {url}: {str(e)}')
+            self._log_request_error(e, f'repairability page {url}')
             raise
 
     # --- Cart Endpoints ---
@@ -238,7 +695,7 @@ class IFixitAPIClient:
         Returns:
             Product details.
         """
-        return self._request('GET', f'/cart/product/{itemcode}/{langid}')
+        return self._get(f'/cart/product/{itemcode}/{langid}')
 
     # --- Authentication Endpoints ---
 
@@ -251,7 +708,7 @@ class IFixitAPIClient:
         Returns:
             Token details.
         """
-        return self._request('POST', '/user/token', json=data)
+        return self._post('/user/token', json=data)
 
     def reset_password(self, data: Dict) -> Dict:
         """Reset user password.
@@ -262,7 +719,7 @@ class IFixitAPIClient:
         Returns:
             Response details.
         """
-        return self._request('POST', '/users/reset_password', json=data)
+        return self._post('/users/reset_password', json=data)
 
     def create_user(self, data: Dict) -> Dict:
         """Create a new user.
@@ -273,11 +730,11 @@ class IFixitAPIClient:
         Returns:
             User details.
         """
-        return self._request('POST', '/users', json=data)
+        return self._post('/users', json=data)
 
     def delete_user_token(self) -> None:
         """Delete the current user token."""
-        return self._request('DELETE', '/user/token')
+        return self._delete('/user/token')
 
     # --- Badges Endpoints ---
 
@@ -287,7 +744,7 @@ class IFixitAPIClient:
         Returns:
             List of badges.
         """
-        return self._request('GET', '/badges')
+        return self._get_static('/badges')
 
     def get_badge(self, badgeid: int) -> Dict:
         """Get a specific badge.
@@ -298,7 +755,7 @@ class IFixitAPIClient:
         Returns:
             Badge details.
         """
-        return self._request('GET', f'/badges/{badgeid}')
+        return self._get_static(f'/badges/{badgeid}')
 
     # --- Content Hierarchy Endpoints ---
 
@@ -308,7 +765,7 @@ class IFixitAPIClient:
         Returns:
             List of categories.
         """
-        return self._request('GET', '/categories')
+        return self._get_static('/categories')
 
     # --- Media Endpoints ---
 
@@ -321,7 +778,7 @@ class IFixitAPIClient:
         Returns:
             Image details.
         """
-        return self._request('GET', f'/media/images/{imageid}')
+        return self._get(f'/media/images/{imageid}')
 
     def get_video(self, videoid: str) -> Dict:
         """Get a video.
@@ -332,7 +789,7 @@ class IFixitAPIClient:
         Returns:
             Video details.
         """
-        return self._request('GET', f'/media/videos/{videoid}')
+        return self._get(f'/media/videos/{videoid}')
 
     # --- Guides Endpoints ---
 
@@ -345,30 +802,73 @@ class IFixitAPIClient:
         Returns:
             List of guides.
         """
-        return self._request('GET', '/guides', params=params)
+        return self._get('/guides', params=params)
 
-    def get_all_guides(self, page_size: int = 100) -> List[Dict]:
+    def get_all_guides(self, page_size: int = 100, concurrency: int = 8) -> List[Dict]:
         """Get all guides by handling pagination.
 
         Args:
             page_size: Number of results per page.
+            concurrency: Number of pages requested in parallel.
 
         Returns:
-            List of all guides.
+            List of all guides, in offset order.
         """
-        all_guides: List[Dict] = []
-        offset = 0
-        while True:
-            batch = self.get_guides(limit=page_size, offset=offset)
-            if not batch:
-                break
-            all_guides.extend(batch)
-            offset += len(batch)
-            logger.info("Fetched %d guides, total so far: %d", len(batch), len(all_guides))
-            if len(batch) < page_size:
-                break
+        all_guides = list(self.iter_all_guides(page_size=page_size, concurrency=concurrency))
+        logger.info("Fetched %d guides in total", len(all_guides))
         return all_guides
 
+    def iter_all_guides(self, page_size: int = 100, concurrency: int = 8) -> Iterator[Dict]:
+        """Iterate over all guides, one page at a time.
+
+        Pages are requested `concurrency` at a time, so the crawl is not bound by one
+        round trip per page. When the first page reports the total in `X-Total-Count`,
+        exactly the remaining pages are requested, a new one as each is consumed;
+        otherwise pages are drained in windows until the first short page. Only the
+        pages in flight are held in memory, so callers can filter guides without
+        building the full list.
+
+        Args:
+            page_size: Number of results per page.
+            concurrency: Number of pages requested in parallel.
+
+        Yields:
+            Guides, in offset order.
+        """
+        def fetch(page_offset: int) -> List[Dict]:
+            return self.get_guides(params={'limit': page_size, 'offset': page_offset}) or []
+
+        first_page, headers = self._request_with_headers(
+            'GET', '/guides', params={'limit': page_size, 'offset': 0})
+        first_page = first_page or []
+        yield from first_page
+        if len(first_page) < page_size:
+            return
+
+        total = headers.get('X-Total-Count', '')
+        offset = page_size
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            if total.isdigit():
+                remaining = iter(range(offset, int(total), page_size))
+                pending = deque(executor.submit(fetch, page_offset)
+                                for page_offset in islice(remaining, concurrency))
+                while pending:
+                    batch = pending.popleft().result()
+                    next_offset = next(remaining, None)
+                    if next_offset is not None:
+                        pending.append(executor.submit(fetch, next_offset))
+                    yield from batch
+                return
+
+            while True:
+                offsets = range(offset, offset + page_size * concurrency, page_size)
+                for batch in executor.map(fetch, offsets):
+                    yield from batch
+                    if len(batch) < page_size:
+                        return
+                offset += page_size * concurrency
+                logger.info("Fetched guides up to offset %d", offset)
+
     def get_guide(self, guideid: int) -> Dict:
         """Get a specific guide.
 
@@ -378,7 +878,19 @@ class IFixitAPIClient:
         Returns:
             Guide details.
         """
-        return self._request('GET', f'/guides/{guideid}')
+        return self._get_url(self._GUIDE_URL % (self.BASE_URL, guideid))
+
+    def get_guides_bulk(self, guideids: Iterable[int], max_workers: int = 16) -> Dict[int, Any]:
+        """Get several guides concurrently.
+
+        Args:
+            guideids: Guide IDs.
+            max_workers: Number of requests in flight (keep at most `pool_maxsize`).
+
+        Returns:
+            Dict mapping each guide ID to its details, or to the exception raised fetching it.
+        """
+        return self._fetch_bulk(self.get_guide, guideids, max_workers)
 
     def get_guide_tags(self, guideid: int) -> List[str]:
         """Get tags for a guide.
@@ -389,7 +901,19 @@ class IFixitAPIClient:
         Returns:
             List of tags.
         """
-        return self._request('GET', f'/guides/{guideid}/tags')
+        return self._get_url(self._GUIDE_TAGS_URL % (self.BASE_URL, guideid))
+
+    def get_guide_tags_bulk(self, guideids: Iterable[int], max_workers: int = 16) -> Dict[int, Any]:
+        """Get the tags of several guides concurrently.
+
+        Args:
+            guideids: Guide IDs.
+            max_workers: Number of requests in flight (keep at most `pool_maxsize`).
+
+        Returns:
+            Dict mapping each guide ID to its tags, or to the exception raised fetching them.
+        """
+        return self._fetch_bulk(self.get_guide_tags, guideids, max_workers)
 
     def create_guide(self, data: Dict) -> Dict:
         """Create a new guide.
@@ -400,7 +924,7 @@ class IFixitAPIClient:
         Returns:
             Created guide details.
         """
-        return self._request('POST', '/guides', json=data)
+        return self._post('/guides', json=data)
 
     def update_guide(self, guideid: int, data: Dict,
                      revisionid: Optional[int] = None) -> Dict:
@@ -415,8 +939,7 @@ class IFixitAPIClient:
             Updated guide details.
         """
         params = {'revisionid': revisionid} if revisionid else None
-        return self._request('PATCH', f'/guides/{guideid}', json=data,
-                             params=params)
+        return self._patch(f'/guides/{guideid}', json=data, params=params)
 
     def delete_guide(self, guideid: int) -> None:
         """Delete a guide.
@@ -424,7 +947,7 @@ class IFixitAPIClient:
         Args:
             guideid: Guide ID.
         """
-        return self._request('DELETE', f'/guides/{guideid}')
+        return self._delete(f'/guides/{guideid}')
 
     def restore_guide(self, guideid: int, langid: str) -> Dict:
         """Restore a guide.
@@ -436,7 +959,7 @@ class IFixitAPIClient:
         Returns:
             Restored guide details.
         """
-        return self._request('POST', f'/guides/{guideid}/{langid}/restore')
+        return self._post(f'/guides/{guideid}/{langid}/restore')
 
     def complete_guide(self, guideid: int) -> Dict:
         """Mark a guide as completed.
@@ -447,7 +970,7 @@ class IFixitAPIClient:
         Returns:
             Response details.
         """
-        return self._request('PUT', f'/guides/{guideid}/completed')
+        return self._put(f'/guides/{guideid}/completed')
 
     def uncomplete_guide(self, guideid: int) -> None:
         """Unmark a guide as completed.
@@ -455,7 +978,7 @@ class IFixitAPIClient:
         Args:
             guideid: Guide ID.
         """
-        return self._request('DELETE', f'/guides/{guideid}/completed')
+        return self._delete(f'/guides/{guideid}/completed')
 
     def make_guide_public(self, guideid: int) -> Dict:
         """Make a guide public.
@@ -466,7 +989,7 @@ class IFixitAPIClient:
         Returns:
             Response details.
         """
-        return self._request('PUT', f'/guides/{guideid}/public')
+        return self._put(f'/guides/{guideid}/public')
 
     def make_guide_private(self, guideid: int) -> Dict:
         """Make a guide private.
@@ -477,7 +1000,7 @@ class IFixitAPIClient:
         Returns:
             Response details.
         """
-        return self._request('DELETE', f'/guides/{guideid}/public')
+        return self._delete(f'/guides/{guideid}/public')
 
     def create_guide_step(self, guideid: int, data: Dict) -> Dict:
         """Create a step in a guide.
@@ -489,7 +1012,7 @@ class IFixitAPIClient:
         Returns:
             Created step details.
         """
-        return self._request('POST', f'/guides/{guideid}/steps', json=data)
+        return self._post(f'/guides/{guideid}/steps', json=data)
 
     def update_guide_step(self, guideid: int, stepid: int, data: Dict) -> Dict:
         """Update a guide step.
@@ -502,8 +1025,7 @@ class IFixitAPIClient:
         Returns:
             Updated step details.
         """
-        return self._request('PATCH', f'/guides/{guideid}/steps/{stepid}',
-                             json=data)
+        return self._patch(f'/guides/{guideid}/steps/{stepid}', json=data)
 
     def delete_guide_step(self, guideid: int, stepid: int) -> None:
         """Delete a guide step.
@@ -512,7 +1034,7 @@ class IFixitAPIClient:
             guideid: Guide ID.
             stepid: Step ID.
         """
-        return self._request('DELETE', f'/guides/{guideid}/steps/{stepid}')
+        return self._delete(f'/guides/{guideid}/steps/{stepid}')
 
     def update_guide_step_order(self, guideid: int, data: Dict) -> Dict:
         """Update the order of steps in a guide.
@@ -524,7 +1046,7 @@ class IFixitAPIClient:
         Returns:
             Response details.
         """
-        return self._request('PUT', f'/guides/{guideid}/steporder', json=data)
+        return self._put(f'/guides/{guideid}/steporder', json=data)
 
     def get_guide_users(self, guideid: int) -> List[Dict]:
         """Get users associated with a guide.
@@ -535,7 +1057,7 @@ class IFixitAPIClient:
         Returns:
             List of users.
         """
-        return self._request('GET', f'/guides/{guideid}/users')
+        return self._get_url(self._GUIDE_USERS_URL % (self.BASE_URL, guideid))
 
     def add_user_to_guide(self, guideid: int, userid: int) -> Dict:
         """Add a user to a guide.
@@ -547,7 +1069,7 @@ class IFixitAPIClient:
         Returns:
             Response details.
         """
-        return self._request('PUT', f'/guides/{guideid}/users/{userid}')
+        return self._put(f'/guides/{guideid}/users/{userid}')
 
     def remove_user_from_guide(self, guideid: int, userid: int) -> None:
         """Remove a user from a guide.
@@ -556,7 +1078,7 @@ class IFixitAPIClient:
             guideid: Guide ID.
             userid: User ID.
         """
-        return self._request('DELETE', f'/guides/{guideid}/users/{userid}')
+        return self._delete(f'/guides/{guideid}/users/{userid}')
 
     def get_guide_teams(self, guideid: int) -> List[Dict]:
         """Get teams associated with a guide.
@@ -567,7 +1089,7 @@ class IFixitAPIClient:
         Returns:
             List of teams.
         """
-        return self._request('GET', f'/guides/{guideid}/teams')
+        return self._get(f'/guides/{guideid}/teams')
 
     def add_team_to_guide(self, guideid: int, teamid: int) -> Dict:
         """Add a team to a guide.
@@ -579,7 +1101,7 @@ class IFixitAPIClient:
         Returns:
             Response details.
         """
-        return self._request('PUT', f'/guides/{guideid}/teams/{teamid}')
+        return self._put(f'/guides/{guideid}/teams/{teamid}')
 
     def remove_team_from_guide(self, guideid: int, teamid: int) -> None:
         """Remove a team from a guide.
@@ -588,7 +1110,7 @@ class IFixitAPIClient:
             guideid: Guide ID.
             teamid: Team ID.
         """
-        return self._request('DELETE', f'/guides/{guideid}/teams/{teamid}')
+        return self._delete(f'/guides/{guideid}/teams/{teamid}')
 
     def get_guide_releases(self) -> List[Dict]:
         """Get all guide releases.
@@ -596,7 +1118,7 @@ class IFixitAPIClient:
         Returns:
             List of releases.
         """
-        return self._request('GET', '/guides/releases')
+        return self._get('/guides/releases')
 
     def delete_guide_release(self, releaseid: int) -> None:
         """Delete a guide release.
@@ -604,7 +1126,7 @@ class IFixitAPIClient:
         Args:
             releaseid: Release ID.
         """
-        return self._request('DELETE', f'/guides/releases/{releaseid}')
+        return self._delete(f'/guides/releases/{releaseid}')
 
     def get_guide_specific_releases(self, guideid: int) -> List[Dict]:
         """Get releases for a specific guide.
@@ -615,7 +1137,7 @@ class IFixitAPIClient:
         Returns:
             List of releases.
         """
-        return self._request('GET', f'/guides/{guideid}/releases')
+        return self._get(f'/guides/{guideid}/releases')
 
     def create_guide_release(self, data: Dict) -> Dict:
         """Create a guide release.
@@ -626,7 +1148,7 @@ class IFixitAPIClient:
         Returns:
             Created release details.
         """
-        return self._request('POST', '/guides/releases', json=data)
+        return self._post('/guides/releases', json=data)
 
     def update_guide_release(self, releaseid: int, data: Dict) -> Dict:
         """Update a guide release.
@@ -638,8 +1160,7 @@ class IFixitAPIClient:
         Returns:
             Updated release details.
         """
-        return self._request('PATCH', f'/guides/releases/{releaseid}',
-                             json=data)
+        return self._patch(f'/guides/releases/{releaseid}', json=data)
 
     def add_guide_tag(self, guideid: int, data: Dict) -> Dict:
         """Add a tag to a guide.
@@ -651,7 +1172,7 @@ class IFixitAPIClient:
         Returns:
             Response details.
         """
-        return self._request('PUT', f'/guides/{guideid}/tag', json=data)
+        return self._put(f'/guides/{guideid}/tag', json=data)
 
     def remove_guide_tag(self, guideid: int, data: Dict) -> None:
         """Remove a tag from a guide.
@@ -660,7 +1181,7 @@ class IFixitAPIClient:
             guideid: Guide ID.
             data: Tag payload.
         """
-        return self._request('DELETE', f'/guides/{guideid}/tag', json=data)
+        return self._delete(f'/guides/{guideid}/tag', json=data)
 
     # --- Comments Endpoints ---
 
@@ -670,7 +1191,7 @@ class IFixitAPIClient:
         Returns:
             List of comments.
         """
-        return self._request('GET', '/comments')
+        return self._get('/comments')
 
     def get_comment(self, commentid: int) -> Dict:
         """Get a specific comment.
@@ -681,7 +1202,7 @@ class IFixitAPIClient:
         Returns:
             Comment details.
         """
-        return self._request('GET', f'/comments/{commentid}')
+        return self._get(f'/comments/{commentid}')
 
     def create_comment(self, context: str, contextid: int, data: Dict) -> Dict:
         """Create a comment.
@@ -694,8 +1215,7 @@ class IFixitAPIClient:
         Returns:
             Created comment details.
         """
-        return self._request('POST', f'/comments/{context}/{contextid}',
-                             json=data)
+        return self._post(f'/comments/{context}/{contextid}', json=data)
 
     def update_comment(self, commentid: int, data: Dict) -> Dict:
         """Update a comment.
@@ -707,7 +1227,7 @@ class IFixitAPIClient:
         Returns:
             Updated comment details.
         """
-        return self._request('PATCH', f'/comments/{commentid}', json=data)
+        return self._patch(f'/comments/{commentid}', json=data)
 
     def delete_comment(self, commentid: int) -> None:
         """Delete a comment.
@@ -715,7 +1235,7 @@ class IFixitAPIClient:
         Args:
             commentid: Comment ID.
         """
-        return self._request('DELETE', f'/comments/{commentid}')
+        return self._delete(f'/comments/{commentid}')
 
     # --- Suggest Endpoints ---
 
@@ -730,7 +1250,7 @@ class IFixitAPIClient:
             List of suggestions.
         """
         params = {'doctypes': doctypes}
-        return self._request('GET', f'/suggest/{query}', params=params)
+        return self._get(f'/suggest/{query}', params=params)
 
     # --- Stories Endpoints ---
 
@@ -740,7 +1260,7 @@ class IFixitAPIClient:
         Returns:
             List of stories.
         """
-        return self._request('GET', '/stories')
+        return self._get('/stories')
 
     def get_story(self, storyid: int) -> Dict:
         """Get a specific story.
@@ -751,7 +1271,7 @@ class IFixitAPIClient:
         Returns:
             Story details.
         """
-        return self._request('GET', f'/stories/{storyid}')
+        return self._get(f'/stories/{storyid}')
 
     def create_story(self, data: Dict) -> Dict:
         """Create a story.
@@ -762,7 +1282,7 @@ class IFixitAPIClient:
         Returns:
             Created story details.
         """
-        return self._request('POST', '/stories', json=data)
+        return self._post('/stories', json=data)
 
     def update_story(self, storyid: int, data: Dict) -> Dict:
         """Update a story.
@@ -774,7 +1294,7 @@ class IFixitAPIClient:
         Returns:
             Updated story details.
         """
-        return self._request('PATCH', f'/stories/{storyid}', json=data)
+        return self._patch(f'/stories/{storyid}', json=data)
 
     # --- Tags Endpoints ---
 
@@ -784,7 +1304,7 @@ class IFixitAPIClient:
         Returns:
             List of tags.
         """
-        return self._request('GET', '/tags')
+        return self._get_static('/tags')
 
     def add_wiki_tag(self, namespace: str, title: str, data: Dict) -> Dict:
         """Add a tag to a wiki.
@@ -797,8 +1317,7 @@ class IFixitAPIClient:
         Returns:
             Response details.
         """
-        return self._request('PUT', f'/wikis/{namespace}/{title}/tag',
-                             json=data)
+        return self._put(f'/wikis/{namespace}/{title}/tag', json=data)
 
     def remove_wiki_tag(self, namespace: str, title: str, data: Dict) -> None:
         """Remove a tag from a wiki.
@@ -808,8 +1327,7 @@ class IFixitAPIClient:
             title: Wiki title.
             data: Tag payload.
         """
-        return self._request('DELETE', f'/wikis/{namespace}/{title}/tag',
-                             json=data)
+        return self._delete(f'/wikis/{namespace}/{title}/tag', json=data)
 
     # --- Teams Endpoints ---
 
@@ -819,7 +1337,7 @@ class IFixitAPIClient:
         Returns:
             List of teams.
         """
-        return self._request('GET', '/teams')
+        return self._get('/teams')
 
     def get_team_members(self, teamid: int) -> List[Dict]:
         """Get members of a team.
@@ -830,7 +1348,7 @@ class IFixitAPIClient:
         Returns:
             List of members.
         """
-        return self._request('GET', f'/teams/{teamid}')
+        return self._get(f'/teams/{teamid}')
 
     def add_user_to_team(self, teamid: int, userid: int) -> Dict:
         """Add a user to a team.
@@ -842,7 +1360,7 @@ class IFixitAPIClient:
         Returns:
             Response details.
         """
-        return self._request('PUT', f'/teams/{teamid}/users/{userid}')
+        return self._put(f'/teams/{teamid}/users/{userid}')
 
     def remove_user_from_team(self, teamid: int, userid: int) -> None:
         """Remove a user from a team.
@@ -851,7 +1369,7 @@ class IFixitAPIClient:
             teamid: Team ID.
             userid: User ID.
         """
-        return self._request('DELETE', f'/teams/{teamid}/users/{userid}')
+        return self._delete(f'/teams/{teamid}/users/{userid}')
 
     # --- Users Endpoints ---
 
@@ -861,7 +1379,7 @@ class IFixitAPIClient:
         Returns:
             List of users.
         """
-        return self._request('GET', '/users')
+        return self._get('/users')
 
     def search_users(self, search: str) -> List[Dict]:
         """Search for users.
@@ -872,7 +1390,7 @@ class IFixitAPIClient:
         Returns:
             List of matching users.
         """
-        return self._request('GET', f'/users/search/{search}')
+        return self._get(f'/users/search/{search}')
 
     def get_user(self, userid: int) -> Dict:
         """Get a specific user.
@@ -883,7 +1401,19 @@ class IFixitAPIClient:
         Returns:
             User details.
         """
-        return self._request('GET', f'/users/{userid}')
+        return self._get(f'/users/{userid}')
+
+    def get_users_bulk(self, userids: Iterable[int], max_workers: int = 16) -> Dict[int, Any]:
+        """Get several users concurrently.
+
+        Args:
+            userids: User IDs.
+            max_workers: Number of requests in flight (keep at most `pool_maxsize`).
+
+        Returns:
+            Dict mapping each user ID to its details, or to the exception raised fetching it.
+        """
+        return self._fetch_bulk(self.get_user, userids, max_workers)
 
     def get_user_by_sso(self, sso_userid: str) -> Dict:
         """Get a user by SSO ID.
@@ -894,7 +1424,7 @@ class IFixitAPIClient:
         Returns:
             User details.
         """
-        return self._request('GET', f'/users/sso/{sso_userid}')
+        return self._get(f'/users/sso/{sso_userid}')
 
     def get_user_by_email(self, email: str) -> Dict:
         """Get a user by email.
@@ -905,7 +1435,7 @@ class IFixitAPIClient:
         Returns:
             User details.
         """
-        return self._request('GET', f'/users/email/{email}')
+        return self._get(f'/users/email/{email}')
 
     def get_user_badges(self, userid: int) -> List[Dict]:
         """Get badges for a user.
@@ -916,7 +1446,7 @@ class IFixitAPIClient:
         Returns:
             List of badges.
         """
-        return self._request('GET', f'/users/{userid}/badges')
+        return self._get(f'/users/{userid}/badges')
 
     def get_user_favorite_guides(self, userid: int) -> List[Dict]:
         """Get favorite guides for a user.
@@ -927,7 +1457,7 @@ class IFixitAPIClient:
         Returns:
             List of favorite guides.
         """
-        return self._request('GET', f'/users/{userid}/favorites/guides')
+        return self._get(f'/users/{userid}/favorites/guides')
 
     def get_user_guides(self, userid: int) -> List[Dict]:
         """Get guides for a user.
@@ -938,7 +1468,7 @@ class IFixitAPIClient:
         Returns:
             List of guides.
         """
-        return self._request('GET', f'/users/{userid}/guides')
+        return self._get(f'/users/{userid}/guides')
 
     def get_user_completions(self, userid: int) -> List[Dict]:
         """Get completions for a user.
@@ -949,7 +1479,7 @@ class IFixitAPIClient:
         Returns:
             List of completions.
         """
-        return self._request('GET', f'/users/{userid}/completions')
+        return self._get(f'/users/{userid}/completions')
 
     def get_current_user(self) -> Dict:
         """Get the current authenticated user.
@@ -957,7 +1487,7 @@ class IFixitAPIClient:
         Returns:
             User details.
         """
-        return self._request('GET', '/user')
+        return self._get('/user')
 
     def get_current_user_badges(self) -> List[Dict]:
         """Get badges for the current user.
@@ -965,7 +1495,7 @@ class IFixitAPIClient:
         Returns:
             List of badges.
         """
-        return self._request('GET', '/user/badges')
+        return self._get('/user/badges')
 
     def get_current_user_favorite_guides(self) -> List[Dict]:
         """Get favorite guides for the current user.
@@ -973,7 +1503,7 @@ class IFixitAPIClient:
         Returns:
             List of favorite guides.
         """
-        return self._request('GET', '/user/favorites/guides')
+        return self._get('/user/favorites/guides')
 
     def favorite_guide(self, guideid: int) -> Dict:
         """Favorite a guide for the current user.
@@ -984,7 +1514,7 @@ class IFixitAPIClient:
         Returns:
             Response details.
         """
-        return self._request('PUT', f'/user/favorites/guides/{guideid}')
+        return self._put(f'/user/favorites/guides/{guideid}')
 
     def unfavorite_guide(self, guideid: int) -> None:
         """Unfavorite a guide for the current user.
@@ -992,7 +1522,7 @@ class IFixitAPIClient:
         Args:
             guideid: Guide ID.
         """
-        return self._request('DELETE', f'/user/favorites/guides/{guideid}')
+        return self._delete(f'/user/favorites/guides/{guideid}')
 
     def get_current_user_guides(self) -> List[Dict]:
         """Get guides for the current user.
@@ -1000,7 +1530,7 @@ class IFixitAPIClient:
         Returns:
             List of guides.
         """
-        return self._request('GET', '/user/guides')
+        return self._get('/user/guides')
 
     def get_current_user_flags(self) -> List[Dict]:
         """Get flags for the current user.
@@ -1008,7 +1538,7 @@ class IFixitAPIClient:
         Returns:
             List of flags.
         """
-        return self._request('GET', '/user/flags')
+        return self._get('/user/flags')
 
     def get_current_user_completions(self) -> List[Dict]:
         """Get completions for the current user.
@@ -1016,7 +1546,7 @@ class IFixitAPIClient:
         Returns:
             List of completions.
         """
-        return self._request('GET', '/user/completions')
+        return self._get('/user/completions')
 
     def get_current_user_images(self) -> List[Dict]:
         """Get images for the current user.
@@ -1024,7 +1554,7 @@ class IFixitAPIClient:
         Returns:
             List of images.
         """
-        return self._request('GET', '/user/media/images')
+        return self._get('/user/media/images')
 
     def upload_user_image(self, data: Dict) -> Dict:
         """Upload an image for the current user.
@@ -1035,7 +1565,7 @@ class IFixitAPIClient:
         Returns:
             Uploaded image details.
         """
-        return self._request('POST', '/user/media/images', json=data)
+        return self._post('/user/media/images', json=data)
 
     def delete_user_images(self, imageids: str) -> None:
         """Delete images for the current user.
@@ -1043,7 +1573,7 @@ class IFixitAPIClient:
         Args:
             imageids: Comma-separated image IDs.
         """
-        return self._request('DELETE', f'/user/media/images/{imageids}')
+        return self._delete(f'/user/media/images/{imageids}')
 
     def update_user_image(self, imageid: str, data: Dict) -> Dict:
         """Update a user image.
@@ -1055,8 +1585,7 @@ class IFixitAPIClient:
         Returns:
             Updated image details.
         """
-        return self._request('POST', f'/user/media/images/{imageid}',
-                             json=data)
+        return self._post(f'/user/media/images/{imageid}', json=data)
 
     def get_current_user_videos(self) -> List[Dict]:
         """Get videos for the current user.
@@ -1064,7 +1593,7 @@ class IFixitAPIClient:
         Returns:
             List of videos.
         """
-        return self._request('GET', '/user/media/videos')
+        return self._get('/user/media/videos')
 
     def update_user(self, userid: int, data: Dict) -> Dict:
         """Update a user.
@@ -1076,7 +1605,7 @@ class IFixitAPIClient:
         Returns:
             Updated user details.
         """
-        return self._request('PATCH', f'/users/{userid}', json=data)
+        return self._patch(f'/users/{userid}', json=data)
 
     # --- Wikis Endpoints ---
 
@@ -1095,7 +1624,7 @@ class IFixitAPIClient:
             endpoint += f'/{device_name}'
         if not params:
             params = {'display': 'hierarchy'}
-        return self._request('GET', endpoint, params=params)
+        return self._get(endpoint, params=params)
 
     def get_wikis(self, namespace: str) -> List[Dict]:
         """Get wikis in a namespace.
@@ -1106,7 +1635,7 @@ class IFixitAPIClient:
         Returns:
             List of wikis.
         """
-        return self._request('GET', f'/wikis/{namespace}')
+        return self._get(f'/wikis/{namespace}')
 
     def get_wiki(self, namespace: str, title: str) -> Dict:
         """Get a specific wiki.
@@ -1118,7 +1647,19 @@ class IFixitAPIClient:
         Returns:
             Wiki details.
         """
-        return self._request('GET', f'/wikis/{namespace}/{title}')
+        return self._get(f'/wikis/{namespace}/{title}')
+
+    def get_wikis_bulk(self, wikis: Iterable[Tuple[str, str]], max_workers: int = 16) -> Dict[Tuple[str, str], Any]:
+        """Get several wikis concurrently.
+
+        Args:
+            wikis: (namespace, title) pairs.
+            max_workers: Number of requests in flight (keep at most `pool_maxsize`).
+
+        Returns:
+            Dict mapping each (namespace, title) pair to its details, or to the exception raised fetching it.
+        """
+        return self._fetch_bulk(lambda wiki: self.get_wiki(*wiki), wikis, max_workers)
 
     def get_wiki_tags(self, namespace: str, title: str) -> List[str]:
         """Get tags for a wiki.
@@ -1130,7 +1671,7 @@ class IFixitAPIClient:
         Returns:
             List of tags.
         """
-        return self._request('GET', f'/wikis/{namespace}/{title}/tags')
+        return self._get(f'/wikis/{namespace}/{title}/tags')
 
     def get_category_children(self, title: str) -> List[Dict]:
         """Get children of a category.
@@ -1141,7 +1682,7 @@ class IFixitAPIClient:
         Returns:
             List of children.
         """
-        return self._request('GET', f'/wikis/CATEGORY/{title}/children')
+        return self._get_static(f'/wikis/CATEGORY/{title}/children')
 
     def get_category_identification(self, title: str) -> str:
         """Get identification for a category.
@@ -1152,7 +1693,7 @@ class IFixitAPIClient:
         Returns:
             Identification string.
         """
-        return self._request('GET', f'/wikis/CATEGORY/{title}/identification')
+        return self._get_static(f'/wikis/CATEGORY/{title}/identification')
 
     def create_wiki(self, data: Dict) -> Dict:
         """Create a new wiki.
@@ -1163,7 +1704,7 @@ class IFixitAPIClient:
         Returns:
             Created wiki details.
         """
-        return self._request('POST', '/wikis', json=data)
+        return self._post('/wikis', json=data)
 
     def update_wiki(self, namespace: str, title: str, data: Dict,
                     revisionid: Optional[int] = None) -> Dict:
@@ -1179,8 +1720,7 @@ class IFixitAPIClient:
             Updated wiki details.
         """
         params = {'revisionid': revisionid} if revisionid else None
-        return self._request('PATCH', f'/wikis/{namespace}/{title}',
-                             json=data, params=params)
+        return self._patch(f'/wikis/{namespace}/{title}', json=data, params=params)
 
     def delete_wiki(self, namespace: str, title: str) -> None:
         """Delete a wiki.
@@ -1189,7 +1729,7 @@ class IFixitAPIClient:
             namespace: Wiki namespace.
             title: Wiki title.
         """
-        return self._request('DELETE', f'/wikis/{namespace}/{title}')
+        return self._delete(f'/wikis/{namespace}/{title}')
 
     def revert_wiki(self, namespace: str, title: str, data: Dict) -> Dict:
         """Revert a wiki to a previous state.
@@ -1202,8 +1742,7 @@ class IFixitAPIClient:
         Returns:
             Response details.
         """
-        return self._request('POST', f'/wikis/{namespace}/{title}/revert',
-                             json=data)
+        return self._post(f'/wikis/{namespace}/{title}/revert', json=data)
 
     def set_wiki_parent(self, title: str, data: Dict) -> Dict:
         """Set the parent for a category wiki.
@@ -1215,8 +1754,7 @@ class IFixitAPIClient:
         Returns:
             Response details.
         """
-        return self._request('PUT', f'/wikis/CATEGORY/{title}/parent',
-                             json=data)
+        return self._put(f'/wikis/CATEGORY/{title}/parent', json=data)
 
     # --- User View History Endpoints ---
 
@@ -1229,7 +1767,7 @@ class IFixitAPIClient:
         Returns:
             List of view history entries.
         """
-        return self._request('GET', f'/user_view_history/user/{userid}')
+        return self._get(f'/user_view_history/user/{userid}')
 
     def get_document_view_history(self, doc_type: str, docid: int) -> List[Dict]:
         """Get view history for a document.
@@ -1241,7 +1779,7 @@ class IFixitAPIClient:
         Returns:
             List of view history entries.
         """
-        return self._request('GET', f'/user_view_history/{doc_type}/{docid}')
+        return self._get(f'/user_view_history/{doc_type}/{docid}')
 
     # --- Documents Endpoints ---
 
@@ -1254,4 +1792,202 @@ class IFixitAPIClient:
         Returns:
             Document details.
         """
-        return self._request('GET', f'/documents/{id_or_guid}')
+        return self._get(f'/documents/{id_or_guid}')
+
+
+class AsyncIFixitAPIClient:
+    """An asyncio client for the read-only iFixit API endpoints.
+
+    Independent GETs such as guides, users and documents are awaited concurrently over one
+    aiohttp session, so many requests share its keep-alive connection pool instead of
+    waiting on each other's round trips. Writes stay on the synchronous `IFixitAPIClient`.
+
+    Args:
+        auth_token: Optional authentication token for authorized requests.
+        app_id: Optional app ID for the X-App-Id header.
+        timeout: Request timeout in seconds (default: 30).
+        max_connections: Connections kept open to the API, bounding requests in flight (default: 64).
+        rate_limiter: Optional limiter awaited before every request (default: None).
+
+    Usage:
+        async with AsyncIFixitAPIClient() as client:
+            documents = await client.get_documents_bulk(['abc123', 'def456'])
+    """
+
+    BASE_URL = IFixitAPIClient.BASE_URL
+
+    def __init__(
+            self,
+            auth_token: Optional[str] = None,
+            app_id: Optional[str] = None,
+            timeout: int = 30,
+            max_connections: int = 64,
+            rate_limiter: Optional[_RateLimiter] = None,
+    ) -> None:
+        self._headers = {'Accept': 'application/json'}
+        if auth_token:
+            self._headers['Authorization'] = f'api {auth_token}'
+        if app_id:
+            self._headers['X-App-Id'] = app_id
+        self._timeout = aiohttp.ClientTimeout(total=timeout)
+        self._max_connections = max_connections
+        self._rate_limiter = rate_limiter
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Returns the client's HTTP session, opening it on first use."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self._max_connections, limit_per_host=self._max_connections,
+                                             ttl_dns_cache=300, keepalive_timeout=60)
+            self._session = aiohttp.ClientSession(connector=connector, headers=self._headers,
+                                                  timeout=self._timeout)
+        return self._session
+
+    async def close(self) -> None:
+        """Close the HTTP session, if one was opened."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def _get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """Make a GET API request.
+
+        Args:
+            endpoint: API endpoint path.
+            params: Query parameters; those set to None are left out.
+
+        Returns:
+            JSON response or None.
+
+        Raises:
+            aiohttp.ClientError: For HTTP errors and other request failures.
+            TimeoutError: If the request times out.
+        """
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire_async()
+        session = await self._get_session()
+        url = f'{self.BASE_URL}{endpoint}'
+        if params:
+            params = {k: v for k, v in params.items() if v is not None}
+        logger.debug('Making async GET request to %s with params=%s', url, params)
+        try:
+            async with session.get(url, params=params) as response:
+                retry_after = response.headers.get('Retry-After', '')
+                if response.status == 429 and self._rate_limiter is not None and retry_after.isdigit():
+                    self._rate_limiter.inform_retry_after(int(retry_after))
+                response.raise_for_status()
+                content = await response.read()
+        except (aiohttp.ClientError, TimeoutError) as e:
+            logger.error('Request failed for %s: %s', url, e)
+            raise
+        return _json_loads(content) if content else None
+
+    @staticmethod
+    async def _fetch_bulk(fetch: Callable[[Any], Any], ids: Iterable[Any]) -> Dict[Any, Any]:
+        """Await `fetch` for each ID concurrently.
+
+        Returns:
+            Dict mapping each ID, in input order, to its result or to the request exception it raised.
+        """
+        ids = list(dict.fromkeys(ids))
+        results = await asyncio.gather(*(fetch(item_id) for item_id in ids), return_exceptions=True)
+        request_errors = (aiohttp.ClientError, TimeoutError)
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, request_errors):
+                raise result
+        return dict(zip(ids, results, strict=True))
+
+    async def get_guide(self, guideid: int) -> Dict:
+        """Get a specific guide.
+
+        Args:
+            guideid: Guide ID.
+
+        Returns:
+            Guide details.
+        """
+        return await self._get(f'/guides/{guideid}')
+
+    async def get_guides_bulk(self, guideids: Iterable[int]) -> Dict[int, Any]:
+        """Get several guides concurrently.
+
+        Args:
+            guideids: Guide IDs.
+
+        Returns:
+            Dict mapping each guide ID to its details, or to the exception raised fetching it.
+        """
+        return await self._fetch_bulk(self.get_guide, guideids)
+
+    async def get_user(self, userid: int) -> Dict:
+        """Get a specific user.
+
+        Args:
+            userid: User ID.
+
+        Returns:
+            User details.
+        """
+        return await self._get(f'/users/{userid}')
+
+    async def get_users_bulk(self, userids: Iterable[int]) -> Dict[int, Any]:
+        """Get several users concurrently.
+
+        Args:
+            userids: User IDs.
+
+        Returns:
+            Dict mapping each user ID to its details, or to the exception raised fetching it.
+        """
+        return await self._fetch_bulk(self.get_user, userids)
+
+    async def get_user_view_history(self, userid: int) -> List[Dict]:
+        """Get view history for a user.
+
+        Args:
+            userid: User ID.
+
+        Returns:
+            List of view history entries.
+        """
+        return await self._get(f'/user_view_history/user/{userid}')
+
+    async def get_document_view_history(self, doc_type: str, docid: int) -> List[Dict]:
+        """Get view history for a document.
+
+        Args:
+            doc_type: Document type.
+            docid: Document ID.
+
+        Returns:
+            List of view history entries.
+        """
+        return await self._get(f'/user_view_history/{doc_type}/{docid}')
+
+    async def get_document(self, id_or_guid: str) -> Dict:
+        """Get a document.
+
+        Args:
+            id_or_guid: Document ID or GUID.
+
+        Returns:
+            Document details.
+        """
+        return await self._get(f'/documents/{id_or_guid}')
+
+    async def get_documents_bulk(self, ids_or_guids: Iterable[str]) -> Dict[str, Any]:
+        """Get several documents concurrently.
+
+        Args:
+            ids_or_guids: Document IDs or GUIDs.
+
+        Returns:
+            Dict mapping each ID or GUID to the document, or to the exception raised fetching it.
+        """
+        return await self._fetch_bulk(self.get_document, ids_or_guids)
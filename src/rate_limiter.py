@@ -1,3 +1,4 @@
+import asyncio
 import threading
 import time
 from time import perf_counter
@@ -7,6 +8,8 @@ from typing import Optional
 class _RateLimiter:
     """Token-bucket rate limiter for controlling API request rate."""
 
+    __slots__ = ('_last', '_lock', '_tokens', 'capacity', 'rate')
+
     def __init__(self, rate_per_sec: int, burst: Optional[int] = None) -> None:
         self.rate: float = max(1, rate_per_sec)
         self.capacity: float = burst if burst is not None else self.rate
@@ -14,23 +17,46 @@ class _RateLimiter:
         self._last: float = perf_counter()
         self._lock = threading.Lock()
 
-    def acquire(self) -> None:
-        wait_time = 0.0
-        with self._lock:
-            now = perf_counter()
-            elapsed = now - self._last
-            self._last = now
-            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
-            if self._tokens < 1.0:
-                wait_time = (1.0 - self._tokens) / self.rate
-            else:
-                self._tokens -= 1.0
-                return
-        if wait_time > 0.0:
-            time.sleep(wait_time)
+    def _reserve(self) -> float:
+        """Take a token, going into debt if none is left, and return how long to wait for it."""
         with self._lock:
             now = perf_counter()
             elapsed = now - self._last
             self._last = now
             self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            # Going negative reserves a future token; the debt is repaid by the refill.
             self._tokens -= 1.0
+            return -self._tokens / self.rate if self._tokens < 0.0 else 0.0
+
+    def inform_retry_after(self, seconds: float) -> None:
+        """Hold back all tokens until `seconds` from now, as a server's Retry-After asked.
+
+        The next `acquire` then waits out the server's delay instead of the limiter's own rate.
+        """
+        with self._lock:
+            self._tokens = 0.0
+            self._last = max(self._last, perf_counter() + seconds)
+
+    def acquire(self, sleep: bool = True) -> float:
+        """Reserve a token, by default blocking until it is available.
+
+        The token is reserved in a single critical section and the wait happens outside
+        the lock, so concurrent callers queue up behind each other's reservations.
+
+        Args:
+            sleep: Sleep until the token is due. Pass False to get the wait back instead and
+                do other work before using the token.
+
+        Returns:
+            Seconds the token was (or still is) due in, 0.0 if one was available at once.
+        """
+        wait_time = self._reserve()
+        if sleep and wait_time > 0.0:
+            time.sleep(wait_time)
+        return wait_time
+
+    async def acquire_async(self) -> None:
+        """Like `acquire`, but waits with asyncio.sleep."""
+        wait_time = self.acquire(sleep=False)
+        if wait_time > 0.0:
+            await asyncio.sleep(wait_time)
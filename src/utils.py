@@ -1,7 +1,18 @@
+import functools
 import re
+import string
+import sys
 from typing import List
 
-from constants import TAG_PRIORITIES, FLAG_TO_TAG, METADATA_KEYS
+from constants import DEFAULT_TAG_PRIORITY, TAGS_BY_PRIORITY, FLAG_BITS, TAG_TABLE, METADATA_KEYS
+
+# Any run of characters outside the title alphabet, underscores included, becomes one underscore;
+# this covers whitespace and collapses repeated underscores in the same pass.
+_RE_TITLE_JUNK = re.compile(r"[^A-Za-z0-9().\-]+")
+
+# ASCII fast path for the same rule: a byte table mapping everything outside the title alphabet to '_'.
+_TITLE_ALPHABET = frozenset((string.ascii_letters + string.digits + "().-").encode())
+_TITLE_JUNK_TO_UNDERSCORE = bytes(b if b in _TITLE_ALPHABET else ord("_") for b in range(256))
 
 
 class _DeviceDataUtils:
@@ -19,7 +30,11 @@ class _DeviceDataUtils:
         Returns:
             int: Priority value (0 = starred, 1 = user_contributed, 2 = other).
         """
-        return min((TAG_PRIORITIES.get(tag, 2) for tag in tags), default=2)
+        # Checked from the top rank down, so a starred list returns after one set test.
+        for priority, priority_tags in enumerate(TAGS_BY_PRIORITY):
+            if not priority_tags.isdisjoint(tags):
+                return priority
+        return DEFAULT_TAG_PRIORITY
 
     @staticmethod
     def build_tags_from_flags(raw_flags: list[str] | set[str]) -> list[str]:
@@ -31,9 +46,18 @@ class _DeviceDataUtils:
         Returns:
             List of lowercase tags derived from known flags.
         """
-        return [tag for flag, tag in FLAG_TO_TAG.items() if flag in raw_flags]
+        mask = 0
+        for flag in raw_flags:
+            mask |= FLAG_BITS.get(flag, 0)
+        tags = []
+        while mask:
+            bit = mask & -mask
+            tags.append(TAG_TABLE[bit.bit_length() - 1])
+            mask ^= bit
+        return tags
 
     @staticmethod
+    @functools.lru_cache(maxsize=8192)
     def to_ifixit_title(name: str) -> str:
         """
         Converts a human-readable device name into a normalized iFixit wiki title.
@@ -56,12 +80,15 @@ class _DeviceDataUtils:
         Returns:
             A normalized iFixit wiki title.
         """
-        s = re.sub(r"\s+", "_", name.strip())
-        s = re.sub(r"[^A-Za-z0-9_().\-]+", "_", s)
-        s = re.sub(r"_+", "_", s)
-        s = re.sub(r"\(", "%28", s)
-        s = re.sub(r"\)", "%29", s)
-        return s
+        s = name.strip()
+        if s.isascii():
+            s = s.encode().translate(_TITLE_JUNK_TO_UNDERSCORE).decode()
+            while "__" in s:
+                s = s.replace("__", "_")
+        else:
+            s = _RE_TITLE_JUNK.sub("_", s)
+        # Interned so names that normalize alike share one string as dict keys downstream.
+        return sys.intern(s.replace("(", "%28").replace(")", "%29"))
 
     @staticmethod
     def is_metadata_key(key: str) -> bool:
@@ -69,6 +96,12 @@ class _DeviceDataUtils:
         return key in METADATA_KEYS
 
     @staticmethod
+    def cheap_key(s: str) -> str:
+        """Cheap lookup key (lowercase, spaces to underscores) that skips the regex normalization."""
+        return s.lower().replace(" ", "_")
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
     def normalize_key(s: str) -> str:
         """Normalized key for robust matching between categories/devices and guide groups."""
-        return _DeviceDataUtils.to_ifixit_title(s).lower()
+        return sys.intern(_DeviceDataUtils.to_ifixit_title(s).lower())